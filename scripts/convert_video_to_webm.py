@@ -10,23 +10,82 @@ Usage:
     
 Or convert all MP4 files in a directory:
     python scripts/convert_video_to_webm.py "docs/videos/" --all
+
+Batch conversions run several ffmpeg processes at once; use --jobs to control
+how many:
+    python scripts/convert_video_to_webm.py "docs/videos/" --all --jobs 2
+
+On machines with Intel Quick Sync, VP9 can be hardware encoded (falls back to
+libvpx-vp9 if the vp9_qsv encoder is not available):
+    python scripts/convert_video_to_webm.py "docs/videos/" --all --hwaccel qsv
+
+Long single videos can be split into keyframe-aligned segments that are encoded
+in parallel and joined again:
+    python scripts/convert_video_to_webm.py "docs/videos/long.mp4" --segments 4
 """
 
+import argparse
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+# Resolved once so parallel jobs don't repeat the PATH lookup per ffmpeg call
+FFMPEG_BIN = shutil.which('ffmpeg') or 'ffmpeg'
+FFPROBE_BIN = shutil.which('ffprobe') or 'ffprobe'
+
 
+@lru_cache(maxsize=1)
 def check_ffmpeg():
     """Check if ffmpeg is available."""
+    return shutil.which('ffmpeg') is not None
+
+
+def verify_ffmpeg() -> bool:
+    """Check that the ffmpeg on PATH actually runs (slower than check_ffmpeg)."""
     try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
+        subprocess.run([FFMPEG_BIN, '-version'], capture_output=True, check=True)
         return True
+    except (subprocess.CalledProcessError, OSError):
+        return False
+
+
+@lru_cache(maxsize=None)
+def has_encoder(name: str) -> bool:
+    """Check if this ffmpeg build provides the given encoder (e.g. "vp9_qsv")."""
+    try:
+        result = subprocess.run([FFMPEG_BIN, '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, check=True)
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
+    return any(line.split()[1:2] == [name] for line in result.stdout.splitlines())
+
+
+def probe_duration(input_path: Path):
+    """Return the duration of a media file in seconds, or None if unknown."""
+    try:
+        result = subprocess.run(
+            [FFPROBE_BIN, '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'default=noprint_wrappers=1:nokey=1', str(input_path)],
+            capture_output=True, text=True, check=True
+        )
+        return float(result.stdout.strip())
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return None
+
 
+def default_jobs() -> int:
+    """Number of parallel ffmpeg processes to run for batch conversions."""
+    return max(1, (os.cpu_count() or 1) // 4)
 
-def convert_to_webm(input_path: Path, output_path: Path = None, quality: str = "high"):
+
+def convert_to_webm(input_path: Path, output_path: Path = None, quality: str = "high",
+                    threads: int = None, cpu_used: int = None, hwaccel: str = "cpu"):
     """
     Convert MP4 video to WebM format using ffmpeg.
     
@@ -34,6 +93,9 @@ def convert_to_webm(input_path: Path, output_path: Path = None, quality: str = "
         input_path: Path to input MP4 file
         output_path: Path to output WebM file (default: same name with .webm extension)
         quality: Quality preset - "high", "medium", or "low"
+        threads: Number of encoder threads for this ffmpeg process (default: all CPUs)
+        cpu_used: libvpx speed setting 0-8, higher is faster (default: from quality preset)
+        hwaccel: "cpu" for libvpx-vp9, or "qsv" for Intel Quick Sync (vp9_qsv)
     """
     if not input_path.exists():
         print(f"Error: Input file not found: {input_path}")
@@ -51,19 +113,70 @@ def convert_to_webm(input_path: Path, output_path: Path = None, quality: str = "
     
     preset = quality_presets.get(quality, quality_presets["medium"])
     
+    # Encoder speed per preset (libvpx -cpu-used; 0 = slowest/best, 5 = fast)
+    speed_presets = {
+        "high": 2,
+        "medium": 4,
+        "low": 5
+    }
+    
+    # ICQ quality per preset for vp9_qsv (same scale as the CRF values above)
+    qsv_quality_presets = {
+        "high": 18,
+        "medium": 28,
+        "low": 35
+    }
+    
+    if cpu_used is None:
+        cpu_used = speed_presets.get(quality, speed_presets["medium"])
+    if threads is None:
+        threads = os.cpu_count() or 1
+    
+    if hwaccel == "qsv" and not has_encoder('vp9_qsv'):
+        print("Warning: vp9_qsv encoder not available, falling back to libvpx-vp9")
+        hwaccel = "cpu"
+    
+    if hwaccel == "qsv":
+        # -c:v vp9_qsv: Intel Quick Sync hardware VP9 encoder
+        # -global_quality: Intelligent constant quality (ICQ) level
+        # -tile_cols/-tile_rows: Tiling for the hardware encoder
+        # -async_depth 4: Frames kept in flight on the GPU
+        global_quality = qsv_quality_presets.get(quality, qsv_quality_presets["medium"])
+        video_args = [
+            '-c:v', 'vp9_qsv',
+            '-preset', 'veryfast',
+            '-async_depth', '4',
+            '-tile_cols', '2',
+            '-tile_rows', '1',
+            '-global_quality', str(global_quality),
+        ]
+    else:
+        # -c:v libvpx-vp9: Use VP9 video codec (open source)
+        # -crf: Constant Rate Factor (lower = higher quality, 18-35 range)
+        # -b:v 0: Use CRF mode (variable bitrate)
+        # -row-mt 1: Enable row-based multithreading for faster encoding
+        # -tile-columns 6: Split frames into column tiles (log2, clamped to frame width)
+        #                  so tiles and rows are encoded in parallel
+        # -frame-parallel 0: Keep backward probability updates (better compression)
+        # -deadline good / -cpu-used: Quality/speed tradeoff of the "good" mode
+        video_args = [
+            '-c:v', 'libvpx-vp9',
+            '-row-mt', '1',
+            '-tile-columns', '6',
+            '-frame-parallel', '0',
+            '-threads', str(threads),
+            '-deadline', 'good',
+            '-cpu-used', str(cpu_used),
+            *preset.split(),
+        ]
+    
     # FFmpeg command to convert MP4 to WebM
-    # -c:v libvpx-vp9: Use VP9 video codec (open source)
     # -c:a libopus: Use Opus audio codec (open source)
-    # -crf: Constant Rate Factor (lower = higher quality, 18-35 range)
-    # -b:v 0: Use CRF mode (variable bitrate)
-    # -row-mt 1: Enable row-based multithreading for faster encoding
     cmd = [
-        'ffmpeg',
+        FFMPEG_BIN,
         '-i', str(input_path),
-        '-c:v', 'libvpx-vp9',
+        *video_args,
         '-c:a', 'libopus',
-        '-row-mt', '1',
-        *preset.split(),
         '-y',  # Overwrite output file if it exists
         str(output_path)
     ]
@@ -75,24 +188,192 @@ def convert_to_webm(input_path: Path, output_path: Path = None, quality: str = "
     print()
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # Stream stderr instead of buffering it all, keeping only the tail for
+        # error reporting (ffmpeg writes progress there for the whole encode)
+        stderr_tail = deque(maxlen=50)
+        with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                              text=True, errors='replace') as proc:
+            for line in proc.stderr:
+                stderr_tail.append(line)
+        if proc.returncode != 0:
+            print(f"Error during conversion of {input_path.name}:")
+            print(''.join(stderr_tail))
+            return False
         print(f"✓ Successfully converted to: {output_path}")
         print(f"  Original size: {input_path.stat().st_size / (1024*1024):.2f} MB")
         print(f"  WebM size: {output_path.stat().st_size / (1024*1024):.2f} MB")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error during conversion:")
-        print(e.stderr)
-        return False
     except Exception as e:
         print(f"Error: {e}")
         return False
 
 
+def convert_all(mp4_files, jobs: int, quality: str = "high", threads: int = None,
+                cpu_used: int = None, hwaccel: str = "cpu"):
+    """
+    Convert several MP4 files concurrently.
+    
+    Each worker only waits on its own ffmpeg process, so threads are enough to
+    keep ``jobs`` encoders busy. Unless given, encoder threads are split evenly
+    between jobs.
+    
+    Args:
+        mp4_files: List of input MP4 paths
+        jobs: Maximum number of ffmpeg processes to run at once
+        quality: Quality preset passed to convert_to_webm
+        threads: Encoder threads per ffmpeg process
+        cpu_used: libvpx speed setting passed to convert_to_webm
+        hwaccel: Encoder backend passed to convert_to_webm
+    
+    Returns:
+        Number of files that failed to convert
+    """
+    jobs = max(1, min(jobs, len(mp4_files)))
+    if threads is None:
+        threads = max(1, (os.cpu_count() or 1) // jobs)
+    failures = 0
+    
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(convert_to_webm, mp4_file, quality=quality,
+                            threads=threads, cpu_used=cpu_used, hwaccel=hwaccel): mp4_file
+            for mp4_file in mp4_files
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            mp4_file = futures[future]
+            try:
+                ok = future.result()
+            except Exception as e:
+                print(f"Error converting {mp4_file.name}: {e}")
+                ok = False
+            if not ok:
+                failures += 1
+            print(f"[{done}/{len(futures)}] {'done' if ok else 'FAILED'}: {mp4_file.name}")
+            print()
+    
+    return failures
+
+
+def convert_segmented(input_path: Path, segments: int, output_path: Path = None,
+                      jobs: int = None, quality: str = "high", threads: int = None,
+                      cpu_used: int = None, hwaccel: str = "cpu"):
+    """
+    Convert one long video by encoding segments of it in parallel.
+    
+    The input is split without re-encoding (so cuts land on keyframes), the
+    segments are converted concurrently with convert_all, and the resulting
+    WebM segments are joined with ffmpeg's concat demuxer.
+    
+    Args:
+        input_path: Path to input MP4 file
+        segments: Number of segments to split the input into
+        output_path: Path to output WebM file (default: same name with .webm extension)
+        jobs: Maximum number of segment encodes to run at once (default: segments)
+        quality, threads, cpu_used, hwaccel: Passed to convert_all
+    
+    Returns:
+        True if conversion succeeded
+    """
+    if not input_path.exists():
+        print(f"Error: Input file not found: {input_path}")
+        return False
+    
+    if output_path is None:
+        output_path = input_path.with_suffix('.webm')
+    
+    duration = probe_duration(input_path)
+    if not duration or segments < 2:
+        return convert_to_webm(input_path, output_path, quality=quality, threads=threads,
+                               cpu_used=cpu_used, hwaccel=hwaccel)
+    
+    with tempfile.TemporaryDirectory(prefix='webm_segments_', dir=output_path.parent) as tmp:
+        tmp_dir = Path(tmp)
+        
+        # Split without re-encoding; the segment muxer only cuts on keyframes
+        split_cmd = [
+            FFMPEG_BIN,
+            '-i', str(input_path),
+            '-map', '0',
+            '-c', 'copy',
+            '-f', 'segment',
+            '-segment_time', f"{duration / segments:.3f}",
+            '-reset_timestamps', '1',
+            '-y',
+            str(tmp_dir / 'seg_%03d.mkv')
+        ]
+        print(f"Splitting {input_path.name} into {segments} segments...")
+        try:
+            subprocess.run(split_cmd, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            print(f"Error splitting {input_path.name}:")
+            print(e.stderr)
+            return False
+        
+        seg_files = sorted(tmp_dir.glob('seg_*.mkv'))
+        failures = convert_all(seg_files, jobs or len(seg_files), quality=quality,
+                               threads=threads, cpu_used=cpu_used, hwaccel=hwaccel)
+        if failures:
+            print(f"{failures} segment(s) of {input_path.name} failed to convert")
+            return False
+        
+        # Join the encoded segments without re-encoding
+        list_file = tmp_dir / 'segments.txt'
+        list_file.write_text(
+            ''.join(f"file '{seg.with_suffix('.webm').name}'\n" for seg in seg_files),
+            encoding='utf-8'
+        )
+        concat_cmd = [
+            FFMPEG_BIN,
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(list_file),
+            '-c', 'copy',
+            '-y',
+            str(output_path)
+        ]
+        try:
+            subprocess.run(concat_cmd, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            print(f"Error joining segments of {input_path.name}:")
+            print(e.stderr)
+            return False
+    
+    print(f"✓ Successfully converted to: {output_path}")
+    print(f"  Original size: {input_path.stat().st_size / (1024*1024):.2f} MB")
+    print(f"  WebM size: {output_path.stat().st_size / (1024*1024):.2f} MB")
+    return True
+
+
 def main():
+    parser = argparse.ArgumentParser(
+        description="Convert MP4 videos to WebM format for QtWebEngine compatibility."
+    )
+    parser.add_argument('input', type=Path, help="MP4 file or directory of MP4 files")
+    parser.add_argument('--all', action='store_true', dest='convert_all',
+                        help="Convert all MP4 files in the input directory")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help=f"Parallel ffmpeg processes for --all (default: {default_jobs()}) "
+                             "or --segments (default: one per segment)")
+    parser.add_argument('--quality', choices=['high', 'medium', 'low'], default='high',
+                        help="Quality preset (default: high)")
+    parser.add_argument('--threads', type=int, default=None,
+                        help="Encoder threads per ffmpeg process (default: CPUs / jobs)")
+    parser.add_argument('--cpu-used', type=int, choices=range(0, 9), default=None,
+                        metavar='{0-8}',
+                        help="libvpx speed, higher is faster (default: from quality preset)")
+    parser.add_argument('--hwaccel', choices=['cpu', 'qsv'], default='cpu',
+                        help="VP9 encoder: cpu (libvpx-vp9) or qsv (Intel Quick Sync, "
+                             "falls back to cpu if unavailable)")
+    parser.add_argument('--segments', type=int, default=1,
+                        help="Split a single input file into this many segments and "
+                             "encode them in parallel (default: 1, no splitting)")
+    parser.add_argument('--verify', action='store_true',
+                        help="Run 'ffmpeg -version' before converting to check the "
+                             "install works")
     if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
+    args = parser.parse_args()
     
     if not check_ffmpeg():
         print("Error: ffmpeg is not installed or not in PATH.")
@@ -104,13 +385,22 @@ def main():
         print("           sudo yum install ffmpeg      (RHEL/CentOS)")
         sys.exit(1)
     
-    input_arg = Path(sys.argv[1])
-    convert_all = '--all' in sys.argv
+    if args.verify and not verify_ffmpeg():
+        print(f"Error: ffmpeg was found at {FFMPEG_BIN} but failed to run.")
+        sys.exit(1)
+    
+    input_arg = args.input
     
     if input_arg.is_file():
         # Convert single file
-        convert_to_webm(input_arg)
-    elif input_arg.is_dir() and convert_all:
+        if args.segments > 1:
+            convert_segmented(input_arg, args.segments, jobs=args.jobs, quality=args.quality,
+                              threads=args.threads, cpu_used=args.cpu_used,
+                              hwaccel=args.hwaccel)
+        else:
+            convert_to_webm(input_arg, quality=args.quality, threads=args.threads,
+                            cpu_used=args.cpu_used, hwaccel=args.hwaccel)
+    elif input_arg.is_dir() and args.convert_all:
         # Convert all MP4 files in directory
         mp4_files = list(input_arg.glob('*.mp4'))
         if not mp4_files:
@@ -122,9 +412,12 @@ def main():
             print(f"  - {f.name}")
         print()
         
-        for mp4_file in mp4_files:
-            convert_to_webm(mp4_file)
-            print()
+        failures = convert_all(mp4_files, args.jobs or default_jobs(), quality=args.quality,
+                               threads=args.threads, cpu_used=args.cpu_used,
+                               hwaccel=args.hwaccel)
+        if failures:
+            print(f"{failures} of {len(mp4_files)} file(s) failed to convert")
+            sys.exit(1)
     else:
         print(f"Error: {input_arg} is not a valid file or directory")
         sys.exit(1)
@@ -0,0 +1,53 @@
+"""
+Background tasks for MadsPipeline.
+Runs blocking calls (disk scans, LSL stream resolution) on the Qt thread pool
+and hands their result back to the GUI thread through signals.
+"""
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class TaskSignals(QObject):
+    """Signals used by BackgroundTask to hand its result back to the GUI thread.
+    
+    Create one per widget, parented to it, so results stop being delivered
+    once the widget is destroyed.
+    """
+    
+    succeeded = Signal(object)
+    failed = Signal(str)
+
+
+class BackgroundTask(QRunnable):
+    """Calls a function on a thread pool thread and emits its result or error."""
+    
+    def __init__(self, fn: Callable[[], Any], signals: TaskSignals):
+        super().__init__()
+        self.fn = fn
+        self.signals = signals
+    
+    def run(self):
+        try:
+            value = self.fn()
+        except Exception as e:
+            signal, value = self.signals.failed, str(e)
+        else:
+            signal = self.signals.succeeded
+        try:
+            signal.emit(value)
+        except RuntimeError:
+            # The owning widget (and its signals object) was destroyed meanwhile
+            pass
+
+
+def start_background_task(fn: Callable[[], Any], signals: TaskSignals) -> BackgroundTask:
+    """Run fn on the global thread pool, emitting its result through signals.
+    
+    Returns:
+        The started task; keep a reference while it is running
+    """
+    task = BackgroundTask(fn, signals)
+    task.setAutoDelete(False)
+    QThreadPool.globalInstance().start(task)
+    return task
@@ -4,13 +4,14 @@ This module provides a small class `EmotiBitBrainflowStreamer` which uses BrainF
 `BoardShim` to read EmotiBit data and republishes it to LSL using `pylsl`.
 
 Notes:
-- This is intentionally conservative and pushes per-sample with `local_clock()`.
+- Each BrainFlow read is pushed to LSL as one chunk stamped with `local_clock()`.
 - Requires `brainflow` and `pylsl` installed in the environment.
 """
 from typing import Optional
-import time
 import threading
 
+import numpy as np
+
 try:
     from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
     from brainflow.data_filter import DataFilter
@@ -62,10 +63,10 @@ class EmotiBitBrainflowStreamer:
 
     def stop(self, timeout: float = 5.0):
         if not self._started:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.info("Stopping BrainFlow EmotiBit streamer")
             return
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.info("Stopping BrainFlow EmotiBit streamer")
         self._stop_event.set()
         if self._thread:
             self._thread.join(timeout)
@@ -86,58 +87,53 @@ class EmotiBitBrainflowStreamer:
         board_id = BoardIds.EMOTIBIT_BOARD.value
         board = BoardShim(board_id, params)
         self._board = board
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.info("BrainFlow thread started")
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.info("BrainFlow thread started")
 
         try:
             board.prepare_session()
-                logger.info("BrainFlow board session prepared")
+            logger.info("BrainFlow board session prepared")
             board.start_stream()
-    logger.info("BrainFlow stream started")
+            logger.info("BrainFlow stream started")
 
-            # quick warmup read
-            time.sleep(0.2)
-            data = board.get_board_data()
-    logger.debug(f"BrainFlow got initial data: {data.shape if hasattr(data, 'shape') else 'None'}")
-
-            # If no data yet, wait a bit
-            if data is None or getattr(data, 'size', 0) == 0:
-                            logger.debug(f"BrainFlow after warmup: {data.shape if hasattr(data, 'shape') else 'None'}")
-                time.sleep(0.2)
-                data = board.get_board_data()
-
-            # Fallback channel count
+            # Channel count comes from the board description, no warmup read needed
             try:
-                n_channels = int(data.shape[0]) if data is not None and getattr(data, 'shape', None) else 16
+                n_channels = int(BoardShim.get_num_rows(board_id))
             except Exception:
                 n_channels = 16
-    logger.info(f"Creating LSL stream with {n_channels} channels")
+            logger.info(f"Creating LSL stream with {n_channels} channels")
 
             info = StreamInfo('EmotiBit_BrainFlow', 'EmotiBit', n_channels, self.nominal_srate, 'float32', 'emotibit_brainflow_0')
             outlet = StreamOutlet(info)
             self._outlet = outlet
-    logger.info("LSL outlet created successfully")
+            logger.info("LSL outlet created successfully")
+
+            # Bind hot-loop callables locally to skip global/attribute lookups
+            _local_clock = local_clock
+            push_chunk = outlet.push_chunk
+
+            # Poll once per nominal sample period; waiting on the stop event
+            # (instead of sleeping) lets stop() interrupt the wait immediately
+            poll_interval = 1.0 / self.nominal_srate if self.nominal_srate > 0 else 0.04
 
             # Main loop: read and push samples
-            while not self._stop_event.is_set():
+            while not self._stop_event.wait(poll_interval):
                 data = board.get_board_data()
-                if data is None or getattr(data, 'size', 0) == 0:
-                    time.sleep(0.01)
+                if data is None or data.size == 0:
                     continue
 
-                n_samples = data.shape[1]
-                # push sample-by-sample with current LSL timestamp
-                for i in range(n_samples):
-                    row = data[:, i].astype(float).tolist()
-                    try:
-                        outlet.push_sample(row, timestamp=local_clock())
-                    except Exception:
-                        # swallow occasional LSL errors to keep streaming
-                        pass
-
-                # small sleep to avoid busy-loop
-                time.sleep(0.001)
+                # BrainFlow returns (channels, samples) float64; LSL wants one row per
+                # sample. A single cast+copy gives a contiguous float32 buffer that
+                # pylsl hands to liblsl as-is (no per-sample lists).
+                # Push the whole read in one call; the timestamp is that of the most
+                # recent sample and LSL derives earlier ones from the nominal rate.
+                chunk = np.ascontiguousarray(data.T, dtype=np.float32)
+                try:
+                    push_chunk(chunk, timestamp=_local_clock())
+                except Exception:
+                    # swallow occasional LSL errors to keep streaming
+                    pass
 
         except Exception as e:
             logger.error(f"BrainFlow error: {e}", exc_info=True)
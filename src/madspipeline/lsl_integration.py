@@ -3,16 +3,52 @@ LSL (Lab Streaming Layer) integration for MadsPipeline.
 Handles streaming bridge events to LSL and recording LSL streams during sessions.
 """
 import json
-from typing import List, Dict, Any, Optional
+import os
+import re
+import threading
+from typing import List, Dict, Any, Optional, Iterator, TextIO, Tuple, Callable
 from datetime import datetime
+from pathlib import Path
+
+import numpy as np
 
 try:
-    from pylsl import StreamInfo, StreamOutlet, StreamInlet, resolve_streams, local_clock
+    from pylsl import (StreamInfo, StreamOutlet, StreamInlet, resolve_streams, local_clock,
+                       cf_float32, cf_double64, cf_int32, cf_int16, cf_int8, cf_int64)
+    # numpy dtype matching each numeric LSL channel format (for pull_chunk's dest_obj)
+    _LSL_NUMPY_DTYPES = {
+        cf_float32: np.float32,
+        cf_double64: np.float64,
+        cf_int32: np.int32,
+        cf_int16: np.int16,
+        cf_int8: np.int8,
+        cf_int64: np.int64,
+    }
     LSL_AVAILABLE = True
 except ImportError:
     LSL_AVAILABLE = False
     print("Warning: pylsl not available. LSL integration will be disabled.")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Maximum number of samples pulled from one inlet per record_sample() call
+_PULL_CHUNK_SIZE = 1024
+
+# Seconds to wait for an inlet's clock offset before reusing its previous one
+_TIME_CORRECTION_TIMEOUT = 2.0
+
+# Mouse event type codes for the event_type channel (0 = regular position tracking)
+_EVENT_CODES = {
+    'mouse_press': 1.0,
+    'mouse_release': 2.0,
+    'mouse_move': 3.0,
+    'mouse_scroll': 4.0,
+}
+
 
 class LSLBridgeStreamer:
     """Streams bridge events to LSL."""
@@ -61,7 +97,7 @@ class LSLBridgeStreamer:
         
         try:
             # Convert event to JSON string for LSL
-            event_str = json.dumps(event_data)
+            event_str = _dumps(event_data)
             # Push to LSL stream with current LSL timestamp
             self.outlet.push_sample([event_str], local_clock())
         except Exception as e:
@@ -88,6 +124,9 @@ class LSLMouseTrackingStreamer:
         
         self.session_id = session_id
         self.outlet: Optional[StreamOutlet] = None
+        # Samples queued by queue_position() and their LSL timestamps, pushed by flush()
+        self._pending_samples: List[Tuple[float, float, float]] = []
+        self._pending_timestamps: List[float] = []
         self._create_stream()
     
     def _create_stream(self):
@@ -97,7 +136,7 @@ class LSLMouseTrackingStreamer:
             name='MadsPipeline_MouseTracking',
             type='Mouse',
             channel_count=3,  # x, y, event_type
-            nominal_srate=10,  # 10 Hz (matches tracking timer)
+            nominal_srate=0,  # Irregular rate (pushed per mouse event, each with its own timestamp)
             channel_format='float32',
             source_id=f'session_{self.session_id}'
         )
@@ -116,70 +155,219 @@ class LSLMouseTrackingStreamer:
         # Create outlet
         self.outlet = StreamOutlet(info)
     
-    def push_tracking_data(self, tracking_data: Dict[str, Any]):
-        """Push mouse tracking data to the LSL stream.
+    def queue_position(self, x: float, y: float, event_type: str = ''):
+        """Queue a mouse position to be pushed by the next flush().
+        
+        The sample keeps the LSL time at which it was queued, so batching
+        does not change its timestamp. Event types are encoded as floats:
+        0=position, 1=press, 2=release, 3=move, 4=scroll.
         
         Args:
-            tracking_data: Tracking data dictionary with mouse_position, event_type, etc.
+            x, y: Mouse position
+            event_type: Mouse event name ('mouse_press', 'mouse_move', ...), or '' for a position sample
         """
+        self._pending_samples.append((x, y, _EVENT_CODES.get(event_type, 0.0)))
+        self._pending_timestamps.append(local_clock())
+    
+    def flush(self):
+        """Push all queued tracking samples to the LSL stream as one chunk."""
+        if not self._pending_samples:
+            return
+        samples, timestamps = self._pending_samples, self._pending_timestamps
+        self._pending_samples, self._pending_timestamps = [], []
         if not self.outlet:
             return
         
         try:
-            # Extract mouse position
-            mouse_pos = tracking_data.get('mouse_position', (0, 0))
-            x = float(mouse_pos[0]) if isinstance(mouse_pos, (tuple, list)) and len(mouse_pos) >= 2 else 0.0
-            y = float(mouse_pos[1]) if isinstance(mouse_pos, (tuple, list)) and len(mouse_pos) >= 2 else 0.0
-            
-            # Extract event type (encode as float: 0=position, 1=press, 2=release, 3=move, 4=scroll)
-            event_type_str = tracking_data.get('event_type', '')
-            if event_type_str == 'mouse_press':
-                event_type = 1.0
-            elif event_type_str == 'mouse_release':
-                event_type = 2.0
-            elif event_type_str == 'mouse_move':
-                event_type = 3.0
-            elif event_type_str == 'mouse_scroll':
-                event_type = 4.0
-            else:
-                event_type = 0.0  # Regular position tracking
-            
-            # Push to LSL stream with current LSL timestamp
-            self.outlet.push_sample([x, y, event_type], local_clock())
+            self.outlet.push_chunk(samples, timestamps)
         except Exception as e:
             print(f"Error pushing mouse tracking to LSL: {e}")
     
     def close(self):
-        """Close the LSL stream outlet."""
+        """Push any queued samples and close the LSL stream outlet."""
+        self.flush()
         if self.outlet:
             # LSL outlets are automatically closed when the object is deleted
             self.outlet = None
 
 
+def _compile_name_filters(name_filters: Optional[List[str]]) -> Optional["re.Pattern[str]"]:
+    """Compile stream name filters into one case-insensitive substring pattern.
+    
+    Returns:
+        Compiled pattern, or None if there are no non-empty filters
+    """
+    if not name_filters:
+        return None
+    alternatives = [re.escape(f) for f in name_filters if f]
+    if not alternatives:
+        return None
+    return re.compile('|'.join(alternatives), re.IGNORECASE)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize obj to a compact JSON string, using orjson when available.
+    
+    NaN and Infinity are written as such (like json.dumps), not as null.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            encoded = orjson.dumps(obj)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles those
+            pass
+        else:
+            # orjson writes non-finite floats as null; only then is the stdlib needed
+            if b'null' not in encoded:
+                return encoded.decode('utf-8')
+    return json.dumps(obj)
+
+
+def _loads(data: str) -> Any:
+    """Parse a JSON string, using orjson when available.
+    
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity written by _dumps; the stdlib parser accepts those
+            pass
+    return json.loads(data)
+
+
+class _StreamBuffer:
+    """Growable struct-of-arrays storage for the samples of one recorded stream.
+    
+    Per-sample values live in contiguous numpy arrays that grow geometrically.
+    Numeric stream data is a 2-D (samples x channels) array in the stream's own
+    dtype (e.g. float32); string stream data (e.g. bridge event markers) is kept
+    as a list of samples.
+    
+    With max_size set, the oldest samples are discarded once the buffer is full
+    (keeping the newest half); `dropped` counts how many were discarded.
+    """
+    
+    _COLUMNS = ('timestamps', 'clock_offsets', 'local_times')
+    
+    def __init__(self, channel_count: int, numeric: bool, capacity: int = 1024,
+                 max_size: Optional[int] = None, dtype=np.float64):
+        self.size = 0
+        self.dropped = 0
+        self.max_size = max_size
+        self.numeric = numeric
+        self.timestamps = np.empty(capacity, dtype=np.float64)
+        self.clock_offsets = np.empty(capacity, dtype=np.float64)
+        self.local_times = np.empty(capacity, dtype=np.float64)
+        self.data = np.empty((capacity, channel_count), dtype=dtype) if numeric else []
+    
+    def _reserve(self, n: int):
+        """Make room for n more samples, doubling capacity when full."""
+        needed = self.size + n
+        capacity = len(self.timestamps)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+        if self.numeric:
+            new = np.empty((new_capacity, self.data.shape[1]), dtype=self.data.dtype)
+            new[:self.size] = self.data[:self.size]
+            self.data = new
+    
+    def _discard(self, n: int):
+        """Discard the n oldest samples.
+        
+        The kept samples are copied into new arrays so views handed out earlier
+        are never overwritten.
+        """
+        keep = self.size - n
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.empty(len(old), dtype=old.dtype)
+            new[:keep] = old[n:self.size]
+            setattr(self, name, new)
+        if self.numeric:
+            new = np.empty_like(self.data)
+            new[:keep] = self.data[n:self.size]
+            self.data = new
+        else:
+            self.data = self.data[n:]
+        self.size = keep
+        self.dropped += n
+    
+    def append(self, samples, timestamps, clock_offset: float, local_time: float):
+        """Append a chunk of samples sharing one clock offset measurement."""
+        n = len(timestamps)
+        if self.max_size and self.size + n > self.max_size:
+            self._discard(self.size - max(0, self.max_size // 2 - n))
+        self._reserve(n)
+        start, end = self.size, self.size + n
+        self.timestamps[start:end] = timestamps
+        self.clock_offsets[start:end] = clock_offset
+        self.local_times[start:end] = local_time
+        if self.numeric:
+            self.data[start:end] = samples
+        else:
+            self.data.extend(samples)
+        self.size = end
+    
+    def sample_data(self, j: int) -> list:
+        """Return the data of sample j as a list."""
+        return self.data[j].tolist() if self.numeric else self.data[j]
+
+
 class LSLRecorder:
     """Records LSL streams during a session."""
     
-    def __init__(self, session_id: str):
+    def __init__(self, session_id: str, max_samples_in_memory: Optional[int] = None):
         """Initialize LSL recorder.
         
         Args:
             session_id: Session ID for recording identification
+            max_samples_in_memory: Optional cap on the samples kept in memory per
+                stream; older samples are discarded once it is reached. Use for
+                live views that do not save the recording.
         """
         if not LSL_AVAILABLE:
             raise RuntimeError("pylsl is not available. Cannot create LSL recorder.")
         
         self.session_id = session_id
-        self.recorded_data: List[Dict[str, Any]] = []
+        self.max_samples_in_memory = max_samples_in_memory
+        self._buffers: List[_StreamBuffer] = []  # One per inlet, same order as stream_info
+        # Preallocated pull_chunk destination per inlet (None for string streams)
+        self._pull_buffers: List[Optional[np.ndarray]] = []
         self.inlets: List[StreamInlet] = []
+        self._clock_offsets: List[float] = []  # Last clock offset measured per inlet
         self.stream_info: List[Dict[str, Any]] = []
         self.is_recording = False
         self.session_start_time: Optional[float] = None
+        # Wall clock at session_start_time; pins LSL timestamps to wall-clock time
+        self.recording_started_wall_clock: Optional[str] = None
+        # Incremental on-disk storage (newline-delimited JSON, one sample per line)
+        self.spool_path: Optional[Path] = None
+        self._spool: Optional[TextIO] = None
+        self._spooled_count = 0
+        # Background polling (see start_polling); the lock guards the buffers
+        self._lock = threading.Lock()
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
     
-    def start_recording(self, wait_time: float = 1.0, stream_name_filters: Optional[List[str]] = None):
+    def start_recording(self, wait_time: float = 1.0, stream_name_filters: Optional[List[str]] = None,
+                        spool_path: Optional[str] = None):
         """Start recording LSL streams.
         
         Args:
             wait_time: Time in seconds to wait for resolving streams
+            stream_name_filters: Optional stream name filters (exact or substring match)
+            spool_path: Optional path of a newline-delimited JSON file. If given, samples
+                are appended to it as they are pulled instead of being kept in memory,
+                so memory use stays constant for long sessions.
         """
         if self.is_recording:
             return
@@ -195,14 +383,12 @@ class LSLRecorder:
                 return
 
             # Optionally filter streams by name (exact or substring match, case-insensitive)
-            filtered_streams = []
-            if stream_name_filters:
-                lower_filters = [f.lower() for f in stream_name_filters if f]
-                for s in streams:
-                    name = s.name() or ''
-                    lname = name.lower()
-                    if any(f == lname or f in lname for f in lower_filters):
-                        filtered_streams.append(s)
+            filter_pattern = _compile_name_filters(stream_name_filters)
+            if filter_pattern:
+                filtered_streams = [s for s in streams if filter_pattern.search(s.name() or '')]
+            elif stream_name_filters:
+                # Only empty filters were given, so nothing can match
+                filtered_streams = []
             else:
                 filtered_streams = streams
 
@@ -214,6 +400,15 @@ class LSLRecorder:
             for stream in filtered_streams:
                 inlet = StreamInlet(stream)
                 self.inlets.append(inlet)
+                self._clock_offsets.append(0.0)
+                dtype = _LSL_NUMPY_DTYPES.get(stream.channel_format())
+                self._buffers.append(_StreamBuffer(stream.channel_count(), numeric=dtype is not None,
+                                                   max_size=self.max_samples_in_memory,
+                                                   dtype=dtype or np.float64))
+                self._pull_buffers.append(
+                    np.empty((_PULL_CHUNK_SIZE, stream.channel_count()), dtype=dtype)
+                    if dtype is not None else None
+                )
 
                 # Store stream info
                 info = {
@@ -226,7 +421,13 @@ class LSLRecorder:
                 self.stream_info.append(info)
                 print(f"Recording stream: {stream.name()} ({stream.type()})")
             
+            if spool_path:
+                self.spool_path = Path(spool_path)
+                self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spool = open(self.spool_path, 'w', encoding='utf-8')
+            
             self.session_start_time = local_clock()
+            self.recording_started_wall_clock = datetime.now().isoformat()
             self.is_recording = True
             print(f"Started recording {len(self.inlets)} LSL stream(s)")
             
@@ -234,43 +435,57 @@ class LSLRecorder:
             print(f"Error starting LSL recording: {e}")
             self.is_recording = False
     
-    def record_sample(self):
-        """Pull and record samples from all LSL streams."""
+    def record_sample(self) -> int:
+        """Pull and record all buffered samples from all LSL streams.
+        
+        Returns:
+            Number of samples recorded
+        """
         if not self.is_recording:
-            return
+            return 0
         
+        _local_clock = local_clock
+        buffers = self._buffers
+        pull_buffers = self._pull_buffers
+        clock_offsets = self._clock_offsets
+        recorded = 0
+        # stop_recording() replaces the list rather than clearing it
         for i, inlet in enumerate(self.inlets):
             try:
-                # Pull sample with no timeout (non-blocking)
+                # Drain everything buffered for this inlet in one call (non-blocking).
+                # Numeric streams are written by liblsl straight into a preallocated
+                # array instead of being converted to nested Python lists.
                 # Use try-except to handle cases where no sample is available
+                dest = pull_buffers[i]
                 try:
-                    sample, timestamp = inlet.pull_sample(timeout=0.0)
+                    samples, timestamps = inlet.pull_chunk(timeout=0.0, max_samples=_PULL_CHUNK_SIZE,
+                                                           dest_obj=dest)
                 except Exception:
                     # No sample available or stream closed - this is normal
                     continue
                 
-                if sample:
-                    # Calculate relative timestamp from session start
-                    relative_time = timestamp - self.session_start_time if self.session_start_time else 0.0
-                    
+                if timestamps:
+                    if dest is not None:
+                        samples = dest[:len(timestamps)]
                     # Get clock offset for synchronization (CRITICAL for multi-device alignment)
                     # The clock offset represents the difference between the remote device's clock
                     # and the local machine's clock. This is essential for proper synchronization.
-                    clock_offset = inlet.time_correction()  # Returns offset in seconds
-                    
-                    # Record the sample
-                    recorded_sample = {
-                        'timestamp': timestamp,
-                        'relative_time': relative_time,
-                        'data': sample,
-                        'stream_index': i,
-                        'stream_info': self.stream_info[i],
-                        'session_id': self.session_id,
-                        'recorded_at': datetime.now().isoformat(),
-                        'clock_offset': clock_offset,  # NEW: For post-hoc synchronization
-                        'local_time_when_recorded': local_clock()  # NEW: Reference for offset measurement timing
-                    }
-                    self.recorded_data.append(recorded_sample)
+                    # It is a round-trip to the remote host, so query it once per chunk.
+                    try:
+                        clock_offset = inlet.time_correction(timeout=_TIME_CORRECTION_TIMEOUT)  # Seconds
+                        clock_offsets[i] = clock_offset
+                    except Exception:
+                        clock_offset = clock_offsets[i]
+                    with self._lock:
+                        if not self.is_recording:
+                            # stop_recording() ran while this chunk was pulled
+                            break
+                        if self._spool:
+                            self._spool_chunk(i, samples, timestamps, clock_offset)
+                        else:
+                            buffers[i].append(samples, timestamps, clock_offset,
+                                              local_time=_local_clock())
+                    recorded += len(timestamps)
                     
             except Exception as e:
                 # Continue with other streams if one fails - don't print every error
@@ -279,103 +494,266 @@ class LSLRecorder:
                     # Suppress frequent error messages
                     pass
                 continue
+        return recorded
+    
+    def start_polling(self, interval: float = 0.005,
+                      on_samples: Optional[Callable[[], None]] = None):
+        """Record samples on a background thread instead of calling record_sample().
+        
+        Args:
+            interval: Seconds to wait between polls of the inlets
+            on_samples: Optional callback invoked (on the polling thread) after
+                new samples were recorded
+        """
+        if self._poll_thread or not self.is_recording:
+            return
+        self._poll_stop.clear()
+        
+        def _poll_loop():
+            while not self._poll_stop.wait(interval):
+                if self.record_sample() and on_samples:
+                    try:
+                        on_samples()
+                    except Exception as e:
+                        print(f"Error in LSL samples callback: {e}")
+        
+        self._poll_thread = threading.Thread(target=_poll_loop, name='LSLRecorderPollThread', daemon=True)
+        self._poll_thread.start()
+    
+    def stop_polling(self, timeout: float = 1.0):
+        """Stop the background polling thread started by start_polling().
+        
+        If the thread is still busy after `timeout` seconds it is kept (and
+        start_polling() will not start another); it exits after its current poll.
+        """
+        if not self._poll_thread:
+            return
+        self._poll_stop.set()
+        self._poll_thread.join(timeout)
+        if not self._poll_thread.is_alive():
+            self._poll_thread = None
+    
+    def _spool_chunk(self, stream_index: int, samples, timestamps, clock_offset: float):
+        """Append a chunk of samples to the spool file, one JSON line per sample."""
+        local_time_when_recorded = local_clock()
+        write = self._spool.write
+        dumps = _dumps
+        if isinstance(samples, np.ndarray):
+            samples = samples.tolist()
+        for sample, timestamp in zip(samples, timestamps):
+            write(dumps({
+                'stream_index': stream_index,
+                'timestamp': timestamp,
+                'data': sample,
+                'clock_offset': clock_offset,
+                'local_time_when_recorded': local_time_when_recorded
+            }))
+            write('\n')
+        self._spooled_count += len(timestamps)
+    
+    def _iter_spooled_samples(self) -> Iterator[Dict[str, Any]]:
+        """Read samples back from the spool file, in the order they were recorded."""
+        with self._lock:
+            if self._spool:
+                self._spool.flush()
+        with open(self.spool_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                sample = _loads(line)
+                i = sample['stream_index']
+                timestamp = sample['timestamp']
+                sample['relative_time'] = timestamp - self.session_start_time if self.session_start_time else 0.0
+                sample['stream_info'] = self.stream_info[i]
+                sample['session_id'] = self.session_id
+                yield sample
+    
+    @property
+    def sample_count(self) -> int:
+        """Total number of samples recorded across all streams."""
+        return self._spooled_count + sum(buf.dropped + buf.size for buf in self._buffers)
+    
+    def _build_sample(self, stream_index: int, j: int) -> Dict[str, Any]:
+        """Build the per-sample dictionary for sample j of a stream."""
+        buf = self._buffers[stream_index]
+        timestamp = float(buf.timestamps[j])
+        return {
+            'timestamp': timestamp,
+            'relative_time': timestamp - self.session_start_time if self.session_start_time else 0.0,
+            'data': buf.sample_data(j),
+            'stream_index': stream_index,
+            'stream_info': self.stream_info[stream_index],
+            'session_id': self.session_id,
+            'clock_offset': float(buf.clock_offsets[j]),  # For post-hoc synchronization
+            'local_time_when_recorded': float(buf.local_times[j])  # Reference for offset measurement timing
+        }
+    
+    def _build_samples(self, tail: Optional[int] = None,
+                       starts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """Build sample dictionaries for all streams, ordered by timestamp.
+        
+        Args:
+            tail: If given, only the most recent `tail` samples are built
+            starts: If given, per-stream position (counting discarded samples)
+                of the first sample to consider
+        """
+        with self._lock:
+            return self._build_samples_locked(tail, starts)
+    
+    def _build_samples_locked(self, tail: Optional[int],
+                              starts: Optional[List[int]]) -> List[Dict[str, Any]]:
+        """Same as _build_samples; the caller must hold self._lock."""
+        stream_indices = []
+        sample_indices = []
+        timestamps = []
+        for i, buf in enumerate(self._buffers):
+            start = max(0, buf.size - tail) if tail is not None else 0
+            if starts is not None and i < len(starts):
+                start = max(start, starts[i] - buf.dropped)
+            stream_indices.append(np.full(buf.size - start, i, dtype=np.intp))
+            sample_indices.append(np.arange(start, buf.size, dtype=np.intp))
+            timestamps.append(buf.timestamps[start:buf.size])
+        if not stream_indices:
+            return []
+        stream_indices = np.concatenate(stream_indices)
+        sample_indices = np.concatenate(sample_indices)
+        timestamps = np.concatenate(timestamps)
+        order = np.argsort(timestamps, kind='stable')
+        if tail is not None:
+            order = order[-tail:]
+        return [self._build_sample(int(stream_indices[k]), int(sample_indices[k])) for k in order]
     
     def get_recorded_data(self) -> List[Dict[str, Any]]:
         """Get all recorded LSL data.
         
+        Samples are stored per stream in columnar form; this builds one
+        dictionary per sample, merged across streams in timestamp order.
+        When recording to a spool file, samples are read back from it in the
+        order they were recorded.
+        
         Returns:
             List of recorded samples
         """
-        return self.recorded_data.copy()
+        if self.spool_path:
+            return list(self._iter_spooled_samples())
+        return self._build_samples()
+    
+    def get_samples_since(self, positions: Optional[List[int]],
+                          count: int) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """Get samples recorded after a previous call, for incremental displays.
+        
+        Samples spooled to disk are not included.
+        
+        Args:
+            positions: Positions returned by the previous call, or None to start
+                from the beginning
+            count: Maximum number of samples to return (the most recent ones)
+        
+        Returns:
+            Tuple of (new samples oldest first, positions to pass to the next call)
+        """
+        with self._lock:
+            samples = self._build_samples_locked(count, positions)
+            return samples, [buf.dropped + buf.size for buf in self._buffers]
     
     def stop_recording(self):
         """Stop recording LSL streams."""
-        self.is_recording = False
+        self.stop_polling()
+        # A polling thread that is still finishing a poll checks is_recording
+        # under the lock, so it cannot write after the spool is closed
+        with self._lock:
+            self.is_recording = False
+            inlets, self.inlets = self.inlets, []
+            if self._spool:
+                try:
+                    self._spool.close()
+                except Exception:
+                    pass
+                self._spool = None
         
         # Close all inlets
-        for inlet in self.inlets:
+        for inlet in inlets:
             try:
                 inlet.close_stream()
             except Exception:
                 pass
         
-        self.inlets.clear()
-        print(f"Stopped recording. Captured {len(self.recorded_data)} samples.")
+        print(f"Stopped recording. Captured {self.sample_count} samples.")
+    
+    @staticmethod
+    def _parse_sample(sample: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a recorded sample into its saved form, decoding JSON bridge events."""
+        try:
+            data = sample['data']
+            stream_info = sample.get('stream_info', {})
+            parsed = {
+                'timestamp': sample['timestamp'],
+                'relative_time': sample['relative_time'],
+                'stream_name': stream_info.get('name', 'unknown'),
+                'stream_type': stream_info.get('type', 'unknown'),
+                'data': data,
+            }
+            if isinstance(data, list) and data:
+                # String samples (bridge events) are JSON; anything else is kept raw
+                if isinstance(data[0], str):
+                    try:
+                        parsed['data'] = _loads(data[0])
+                    except ValueError:
+                        pass
+                parsed['raw_data'] = data
+            parsed['clock_offset'] = sample.get('clock_offset')  # PRESERVE: Clock offset for sync
+            parsed['local_time_when_recorded'] = sample.get('local_time_when_recorded')  # PRESERVE: Timing reference
+            return parsed
+        except Exception:
+            # Keep original sample if parsing fails
+            return sample
+    
+    @staticmethod
+    def _write_json(f: TextIO, output_data: Dict[str, Any], samples: Iterator[Dict[str, Any]]):
+        """Write output_data as indented JSON, streaming `samples` as its lsl_samples list.
+        
+        Samples are encoded one at a time (one per line) so the whole recording
+        never has to be held in memory as a single document.
+        """
+        keys = list(output_data.keys())
+        f.write('{\n')
+        for k, key in enumerate(keys):
+            f.write(f'  {json.dumps(key)}: ')
+            if key == 'lsl_samples':
+                f.write('[')
+                first = True
+                for sample in samples:
+                    f.write('\n    ' if first else ',\n    ')
+                    f.write(_dumps(sample))
+                    first = False
+                f.write('\n  ]' if not first else ']')
+            else:
+                f.write(json.dumps(output_data[key], indent=2).replace('\n', '\n  '))
+            f.write(',\n' if k < len(keys) - 1 else '\n')
+        f.write('}\n')
     
     def save_to_file(self, filepath: str, additional_tracking_data: Optional[List[Dict[str, Any]]] = None):
         """Save recorded data to a JSON file, including additional tracking data.
         
+        If samples were spooled to disk, they are streamed from the spool file
+        into the output and the spool file is removed afterwards; from then on
+        those samples are only available from the saved file.
+        
         Args:
             filepath: Path to save the JSON file
             additional_tracking_data: Optional list of tracking data to include (e.g., non-LSL tracked data)
         """
-        import json
-        from pathlib import Path
-        
-        # Parse LSL samples to extract structured data
-        parsed_samples = []
-        for sample in self.recorded_data:
-            try:
-                # Try to parse JSON data from string samples (bridge events)
-                if isinstance(sample['data'], list) and len(sample['data']) > 0:
-                    data_item = sample['data'][0]
-                    if isinstance(data_item, str):
-                        try:
-                            parsed_data = json.loads(data_item)
-                            parsed_samples.append({
-                                'timestamp': sample['timestamp'],
-                                'relative_time': sample['relative_time'],
-                                'stream_name': sample['stream_info']['name'],
-                                'stream_type': sample['stream_info']['type'],
-                                'data': parsed_data,
-                                'raw_data': sample['data'],
-                                'clock_offset': sample.get('clock_offset'),  # PRESERVE: Clock offset for sync
-                                'local_time_when_recorded': sample.get('local_time_when_recorded')  # PRESERVE: Timing reference
-                            })
-                        except json.JSONDecodeError:
-                            # Not JSON, keep as raw
-                            parsed_samples.append({
-                                'timestamp': sample['timestamp'],
-                                'relative_time': sample['relative_time'],
-                                'stream_name': sample['stream_info']['name'],
-                                'stream_type': sample['stream_info']['type'],
-                                'data': sample['data'],
-                                'raw_data': sample['data'],
-                                'clock_offset': sample.get('clock_offset'),  # PRESERVE: Clock offset for sync
-                                'local_time_when_recorded': sample.get('local_time_when_recorded')  # PRESERVE: Timing reference
-                            })
-                    else:
-                        # Numeric data (mouse tracking, etc.)
-                        parsed_samples.append({
-                            'timestamp': sample['timestamp'],
-                            'relative_time': sample['relative_time'],
-                            'stream_name': sample['stream_info']['name'],
-                            'stream_type': sample['stream_info']['type'],
-                            'data': sample['data'],
-                            'raw_data': sample['data'],
-                            'clock_offset': sample.get('clock_offset'),  # PRESERVE: Clock offset for sync
-                            'local_time_when_recorded': sample.get('local_time_when_recorded')  # PRESERVE: Timing reference
-                        })
-                else:
-                    parsed_samples.append({
-                        'timestamp': sample['timestamp'],
-                        'relative_time': sample['relative_time'],
-                        'stream_name': sample.get('stream_info', {}).get('name', 'unknown'),
-                        'stream_type': sample.get('stream_info', {}).get('type', 'unknown'),
-                        'data': sample['data'],
-                        'clock_offset': sample.get('clock_offset'),  # PRESERVE: Clock offset for sync
-                        'local_time_when_recorded': sample.get('local_time_when_recorded')  # PRESERVE: Timing reference
-                    })
-            except Exception as e:
-                # Keep original sample if parsing fails
-                parsed_samples.append(sample)
+        total_samples = self.sample_count
+        if self.spool_path:
+            recorded_samples = self._iter_spooled_samples()
+        else:
+            recorded_samples = iter(self._build_samples())
         
         output_data = {
             'session_id': self.session_id,
             'stream_info': self.stream_info,
             'session_start_time': self.session_start_time,
-            'total_samples': len(self.recorded_data),
-            'lsl_samples': parsed_samples,
+            'recording_started_wall_clock': self.recording_started_wall_clock,
+            'total_samples': total_samples,
+            'lsl_samples': None,  # Streamed by _write_json
             'synchronization_info': {  # NEW: Synchronization metadata
                 'sync_method': 'LSL_local_clock',
                 'clock_offset_type': 'offset between local and remote device clocks (seconds)',
@@ -390,12 +768,17 @@ class LSLRecorder:
         
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
+            self._write_json(f, output_data, (self._parse_sample(sample) for sample in recorded_samples))
         
-        total_items = len(self.recorded_data)
-        if additional_tracking_data:
-            total_items += len(additional_tracking_data)
-        print(f"Saved {len(self.recorded_data)} LSL samples" + 
+        # The spool is fully contained in the saved file now
+        if self.spool_path and not self._spool:
+            try:
+                os.remove(self.spool_path)
+            except OSError:
+                pass
+            self.spool_path = None
+            self._spooled_count = 0
+        
+        print(f"Saved {total_samples} LSL samples" + 
               (f" and {len(additional_tracking_data)} additional tracking events" if additional_tracking_data else "") +
               f" to {filepath}")
-
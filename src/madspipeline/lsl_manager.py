@@ -3,16 +3,22 @@ LSL Stream Management interface for MadsPipeline.
 Provides a dialog for managing LSL streams, including mouse tracking, marker API, Tobii eyetracker, and Emotibit.
 """
 import json
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import subprocess
+
+import numpy as np
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QCheckBox,
     QGroupBox, QFormLayout, QTableWidget, QTableWidgetItem, QLineEdit,
     QTextEdit, QMessageBox, QHeaderView, QAbstractItemView, QComboBox,
-    QSpinBox, QDoubleSpinBox, QScrollArea, QWidget
+    QSpinBox, QDoubleSpinBox, QScrollArea, QWidget, QTableView
+)
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QSignalBlocker,
+    QAbstractTableModel, QModelIndex, QEvent
 )
-from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QFont
 
 try:
@@ -23,6 +29,7 @@ except ImportError:
     print("Warning: pylsl not available. LSL integration will be disabled.")
 
 from .models import Project, LSLConfig
+from .background_task import BackgroundTask, TaskSignals, start_background_task
 from .lsl_integration import LSLBridgeStreamer, LSLMouseTrackingStreamer, LSLRecorder, LSL_AVAILABLE as LSL_INTEGRATION_AVAILABLE
 
 # Optional BrainFlow-based EmotiBit streamer
@@ -33,11 +40,116 @@ except Exception:
     EmotiBitBrainflowStreamer = None
     BRAINFLOW_UI_AVAILABLE = False
 
+# Delay before text field edits are applied to the configuration
+CONFIG_DEBOUNCE_MS = 150
+# Number of most recent samples shown in the test data table
+TEST_TABLE_MAX_ROWS = 50
+# Samples kept in memory per stream while testing (the test is never saved)
+TEST_MAX_SAMPLES_IN_MEMORY = 50_000
+# Minimum interval between test data table refreshes (~30 Hz)
+TEST_TABLE_REFRESH_MS = 33
+# Refresh interval while the dialog is not the active window
+TEST_TABLE_INACTIVE_REFRESH_MS = 500
+
+
+def _format_sample_data(data) -> str:
+    """Format sample data for the test data table (first 5 values, truncated)."""
+    if isinstance(data, np.ndarray):
+        # One C-level conversion, then the same formatting as lists
+        data = data.tolist()
+    if isinstance(data, list):
+        data_str = ', '.join(f"{d:.4g}" if isinstance(d, float) else str(d) for d in data[:5])
+        if len(data) > 5:
+            data_str += f" ... ({len(data)} total)"
+    else:
+        data_str = str(data)
+    return data_str[:100]  # Truncate long data
+
+
+class LSLSampleModel(QAbstractTableModel):
+    """Table model showing the most recent received samples as preformatted rows.
+    
+    Rows live in a fixed ring of max_rows slots allocated up front. Until the
+    ring is full new samples are inserted as rows; after that they overwrite
+    the oldest slots and the view is told the (unchanged) rows changed, so
+    rows are never removed or re-inserted.
+    """
+    
+    HEADERS = ("Time", "Stream", "Channels", "Data")
+    
+    def __init__(self, max_rows: int = TEST_TABLE_MAX_ROWS, parent=None):
+        super().__init__(parent)
+        self.max_rows = max_rows
+        self._slots: List[Optional[tuple]] = [None] * max_rows
+        self._start = 0  # Slot holding the oldest row
+        self._count = 0
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._slots[(self._start + index.row()) % self.max_rows][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def append_samples(self, samples: List[Dict[str, Any]]):
+        """Append recorded samples, overwriting the oldest rows beyond max_rows."""
+        rows = []
+        for sample in samples[-self.max_rows:]:
+            relative_time = sample.get('relative_time', 0.0)
+            stream_name = sample.get('stream_info', {}).get('name', 'Unknown')
+            data = sample.get('data', [])
+            rows.append((
+                f"{relative_time:.3f}s",
+                stream_name,
+                str(len(data) if isinstance(data, (list, np.ndarray)) else 1),
+                _format_sample_data(data),
+            ))
+        if not rows:
+            return
+        
+        # Fill free slots first, as new rows
+        n_insert = min(len(rows), self.max_rows - self._count)
+        if n_insert:
+            first = self._count
+            self.beginInsertRows(QModelIndex(), first, first + n_insert - 1)
+            for row in rows[:n_insert]:
+                self._slots[(self._start + self._count) % self.max_rows] = row
+                self._count += 1
+            self.endInsertRows()
+        
+        # Then overwrite the oldest slots; every visible row shifts up
+        overwrite = rows[n_insert:]
+        if overwrite:
+            for row in overwrite:
+                self._slots[self._start] = row
+                self._start = (self._start + 1) % self.max_rows
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(self._count - 1, len(self.HEADERS) - 1))
+    
+    def clear(self):
+        """Remove all rows."""
+        self.beginResetModel()
+        self._slots = [None] * self.max_rows
+        self._start = 0
+        self._count = 0
+        self.endResetModel()
+
 
 class LSLStreamManagerDialog(QDialog):
     """Dialog for managing LSL streams."""
     
     config_changed = Signal(LSLConfig)  # Emitted when configuration changes
+    # Emitted from the test recorder's polling thread when new samples arrive
+    test_samples_arrived = Signal()
     
     def __init__(self, project: Project, parent=None):
         import logging
@@ -51,7 +163,13 @@ class LSLStreamManagerDialog(QDialog):
         self.available_streams = []
         self.emotibit_process = None
         self.test_recorder: Optional[LSLRecorder] = None
-        self.test_timer: Optional[QTimer] = None
+        # Coalesces test table refreshes; reused across test runs
+        self.test_timer = QTimer(self)
+        self.test_timer.setSingleShot(True)
+        self.test_timer.setInterval(TEST_TABLE_REFRESH_MS)
+        self.test_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.test_timer.timeout.connect(self._update_test_data)
+        self._test_positions: Optional[List[int]] = None  # Recorder positions already shown
         self.is_testing = False
         
         # Initialize config from project
@@ -76,6 +194,19 @@ class LSLStreamManagerDialog(QDialog):
         # Tracks streams selected for recording in the UI
         self.selected_streams = set()
         
+        # Background stream resolution (see _refresh_streams)
+        self._resolve_task: Optional[BackgroundTask] = None
+        self._stream_rows: List[tuple] = []  # Stream metadata shown in each streams table row
+        self._resolve_signals = TaskSignals(self)
+        self._resolve_signals.succeeded.connect(self._on_streams_resolved)
+        self._resolve_signals.failed.connect(self._on_resolve_failed)
+        
+        # Debounces config updates from the text fields
+        self._config_debounce = QTimer(self)
+        self._config_debounce.setSingleShot(True)
+        self._config_debounce.setInterval(CONFIG_DEBOUNCE_MS)
+        self._config_debounce.timeout.connect(self._apply_config_changes)
+        
         self.setWindowTitle(f"LSL Stream Management - {project.name}")
         self.setMinimumSize(800, 600)
         self.setModal(True)
@@ -131,20 +262,20 @@ class LSLStreamManagerDialog(QDialog):
         # Mouse tracking
         self.mouse_tracking_check = QCheckBox()
         self.mouse_tracking_check.setChecked(self.current_config.enable_mouse_tracking)
-        self.mouse_tracking_check.stateChanged.connect(self._on_config_changed)
+        self.mouse_tracking_check.stateChanged.connect(self._apply_config_changes)
         config_layout.addRow("Enable Mouse Tracking:", self.mouse_tracking_check)
         
         # Marker API
         self.marker_api_check = QCheckBox()
         self.marker_api_check.setChecked(self.current_config.enable_marker_api)
-        self.marker_api_check.stateChanged.connect(self._on_config_changed)
+        self.marker_api_check.stateChanged.connect(self._apply_config_changes)
         config_layout.addRow("Enable Marker API:", self.marker_api_check)
         
         # Tobii eyetracker
         tobii_layout = QHBoxLayout()
         self.tobii_check = QCheckBox()
         self.tobii_check.setChecked(self.current_config.enable_tobii_eyetracker)
-        self.tobii_check.stateChanged.connect(self._on_config_changed)
+        self.tobii_check.stateChanged.connect(self._apply_config_changes)
         self.tobii_stream_edit = QLineEdit()
         self.tobii_stream_edit.setPlaceholderText("Auto-detect (leave empty)")
         if self.current_config.tobii_stream_name:
@@ -164,7 +295,7 @@ class LSLStreamManagerDialog(QDialog):
         emotibit_layout = QHBoxLayout()
         self.emotibit_check = QCheckBox()
         self.emotibit_check.setChecked(getattr(self.current_config, 'use_brainflow', False))
-        self.emotibit_check.stateChanged.connect(self._on_config_changed)
+        self.emotibit_check.stateChanged.connect(self._apply_config_changes)
         emotibit_layout.addWidget(self.emotibit_check)
         
         # Optional: IP address field (helps discovery if network is restricted)
@@ -215,10 +346,10 @@ class LSLStreamManagerDialog(QDialog):
         
         # Refresh streams button and inspect channels
         refresh_layout = QHBoxLayout()
-        refresh_button = QPushButton("Refresh Streams")
-        refresh_button.clicked.connect(self._refresh_streams)
-        refresh_button.setEnabled(LSL_AVAILABLE)
-        refresh_layout.addWidget(refresh_button)
+        self.refresh_button = QPushButton("Refresh Streams")
+        self.refresh_button.clicked.connect(self._refresh_streams)
+        self.refresh_button.setEnabled(LSL_AVAILABLE)
+        refresh_layout.addWidget(self.refresh_button)
 
         clear_button = QPushButton("Clear Streams")
         clear_button.clicked.connect(self._clear_streams)
@@ -240,9 +371,9 @@ class LSLStreamManagerDialog(QDialog):
         data_group = QGroupBox("Received Data (Test Mode)")
         data_layout = QVBoxLayout()
         
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(4)
-        self.data_table.setHorizontalHeaderLabels(["Time", "Stream", "Channels", "Data"])
+        self.data_model = LSLSampleModel(parent=self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.data_model)
         self.data_table.horizontalHeader().setStretchLastSection(True)
         self.data_table.setMaximumHeight(200)
         data_layout.addWidget(self.data_table)
@@ -324,7 +455,12 @@ class LSLStreamManagerDialog(QDialog):
             pass
     
     def _on_config_changed(self):
+        """Handle text edits; coalesces bursts of keystrokes into one config update."""
+        self._config_debounce.start()
+    
+    def _apply_config_changes(self):
         """Handle configuration changes."""
+        self._config_debounce.stop()
         # Update current_config from UI
         self.current_config.enable_mouse_tracking = self.mouse_tracking_check.isChecked()
         self.current_config.enable_marker_api = self.marker_api_check.isChecked()
@@ -339,48 +475,98 @@ class LSLStreamManagerDialog(QDialog):
         self.current_config.brainflow_ip = iptxt if iptxt else None
     
     def _refresh_streams(self):
-        """Refresh the list of available LSL streams."""
-        if not LSL_AVAILABLE:
+        """Refresh the list of available LSL streams.
+        
+        Streams are resolved on a thread pool thread so the dialog stays
+        responsive; the table is filled in when the result arrives.
+        """
+        if not LSL_AVAILABLE or self._resolve_task is not None:
             return
         
+        # Resolve streams with a short timeout
+        self.refresh_button.setEnabled(False)
+        self._resolve_task = start_background_task(lambda: list(resolve_streams(1.0)),
+                                                   self._resolve_signals)
+    
+    def _on_streams_resolved(self, streams):
+        """Show the result of a background stream refresh."""
+        self._resolve_task = None
+        self.refresh_button.setEnabled(True)
         try:
-            # Resolve streams with a short timeout
-            streams = resolve_streams(1.0)
-            # Save available streams for inspection
-            self.available_streams = streams
-            
-            self.streams_table.setRowCount(len(streams))
+            self._populate_streams_table(streams)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to refresh streams: {e}")
+    
+    def _on_resolve_failed(self, error: str):
+        """Report a failed background stream refresh."""
+        self._resolve_task = None
+        self.refresh_button.setEnabled(True)
+        QMessageBox.warning(self, "Error", f"Failed to refresh streams: {error}")
+    
+    def _populate_streams_table(self, streams):
+        """Show resolved streams in the streams table, reusing existing rows and widgets."""
+        # Save available streams for inspection
+        self.available_streams = streams
+        
+        table = self.streams_table
+        table.setUpdatesEnabled(False)
+        # Filling the table must not fire itemChanged/stateChanged handlers
+        blocker = QSignalBlocker(table)
+        try:
+            table.setRowCount(len(streams))
+            # Metadata shown in each row; rows whose stream is unchanged are left alone
+            del self._stream_rows[len(streams):]
+            changed = False
+            selected = self.selected_streams  # Set: O(1) membership per row
             
             for i, stream in enumerate(streams):
                 stream_name = stream.name()
                 # Checkbox to indicate recording this stream
-                record_cb = QCheckBox()
-                record_cb.setChecked(stream_name in (self.current_config.additional_stream_filters or []))
-
-                def _cb_state_changed(state, name=stream_name):
-                    if state == Qt.CheckState.Checked:
-                        self.selected_streams.add(name)
-                    else:
-                        self.selected_streams.discard(name)
-
-                record_cb.stateChanged.connect(_cb_state_changed)
-                self.streams_table.setCellWidget(i, 0, record_cb)
-
-                self.streams_table.setItem(i, 1, QTableWidgetItem(stream_name))
-                self.streams_table.setItem(i, 2, QTableWidgetItem(stream.type()))
-                self.streams_table.setItem(i, 3, QTableWidgetItem(str(stream.channel_count())))
-
-                sample_rate = stream.nominal_srate()
+                record_cb = table.cellWidget(i, 0)
+                if record_cb is None:
+                    record_cb = QCheckBox()
+                    record_cb.stateChanged.connect(self._on_record_toggled)
+                    table.setCellWidget(i, 0, record_cb)
+                record_cb.setProperty('stream_name', stream_name)
+                # Show the current selection (initialized from the saved config)
+                with QSignalBlocker(record_cb):
+                    record_cb.setChecked(stream_name in selected)
+                
+                row = (stream_name, stream.type(), stream.channel_count(),
+                       stream.nominal_srate(), stream.source_id())
+                if i < len(self._stream_rows) and self._stream_rows[i] == row:
+                    continue
+                changed = True
+                if i < len(self._stream_rows):
+                    self._stream_rows[i] = row
+                else:
+                    self._stream_rows.append(row)
+                
+                _, stream_type, channel_count, sample_rate, source_id = row
                 sample_rate_str = f"{sample_rate:.1f} Hz" if sample_rate > 0 else "Irregular"
-                self.streams_table.setItem(i, 4, QTableWidgetItem(sample_rate_str))
-
-                self.streams_table.setItem(i, 5, QTableWidgetItem(stream.source_id()))
+                texts = (stream_name, stream_type, str(channel_count), sample_rate_str, source_id)
+                for col, text in enumerate(texts, start=1):
+                    item = table.item(i, col)
+                    if item is None:
+                        table.setItem(i, col, QTableWidgetItem(text))
+                    else:
+                        item.setText(text)
+                table.item(i, 1).setData(Qt.ItemDataRole.UserRole, stream_name)
             
             # Resize columns to content
-            self.streams_table.resizeColumnsToContents()
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to refresh streams: {e}")
+            if changed:
+                table.resizeColumnsToContents()
+        finally:
+            blocker.unblock()
+            table.setUpdatesEnabled(True)
+    
+    def _on_record_toggled(self, state):
+        """Track which streams are selected for recording."""
+        stream_name = self.sender().property('stream_name')
+        if state == Qt.CheckState.Checked.value:
+            self.selected_streams.add(stream_name)
+        else:
+            self.selected_streams.discard(stream_name)
     
     def _toggle_test(self):
         """Toggle stream testing mode."""
@@ -544,6 +730,7 @@ class LSLStreamManagerDialog(QDialog):
         """Clear the list of available streams shown in the table."""
         try:
             self.available_streams = []
+            self._stream_rows.clear()
             self.streams_table.setRowCount(0)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to clear streams: {e}")
@@ -552,49 +739,57 @@ class LSLStreamManagerDialog(QDialog):
         """Start receiving LSL streams for testing."""
         if not LSL_AVAILABLE:
             QMessageBox.warning(self, "Error", "LSL is not available.")
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.info("Starting LSL test receiver")
-                    # First, check if EmotiBit is enabled and streamer is not running
-                    if getattr(self.current_config, 'use_brainflow', False):
-                        logger.info("EmotiBit (BrainFlow) is enabled - checking if streamer is running")
-                        if not getattr(self, 'brainflow_streamer', None):
-                            logger.info("Starting BrainFlow streamer automatically for test")
-                            self._start_brainflow_streamer()
-                            time.sleep(1)  # Give streamer time to start
-        
             return
         
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.info("Starting LSL test receiver")
+        # First, check if EmotiBit is enabled and streamer is not running
+        if getattr(self.current_config, 'use_brainflow', False):
+            logger.info("EmotiBit (BrainFlow) is enabled - checking if streamer is running")
+            if not getattr(self, 'brainflow_streamer', None):
+                logger.info("Starting BrainFlow streamer automatically for test")
+                self._start_brainflow_streamer()
+                time.sleep(1)  # Give streamer time to start
+        
+        samples_connected = False
         try:
             # Create test recorder
             test_session_id = f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            self.test_recorder = LSLRecorder(test_session_id)
-                logger.info(f"Created test recorder with session ID: {test_session_id}")
+            self.test_recorder = LSLRecorder(test_session_id, max_samples_in_memory=TEST_MAX_SAMPLES_IN_MEMORY)
+            logger.info(f"Created test recorder with session ID: {test_session_id}")
             self.test_recorder.start_recording(wait_time=2.0)
-                logger.info(f"Recording started, found {len(getattr(self.test_recorder, 'stream_inlets', []))} LSL streams")
+            logger.info(f"Recording started, found {len(self.test_recorder.inlets)} LSL streams")
             
             if not self.test_recorder.is_recording:
-                            logger.warning("Test recorder failed to find any LSL streams")
+                logger.warning("Test recorder failed to find any LSL streams")
                 QMessageBox.warning(self, "Error", "No LSL streams found for testing.")
                 return
             
-            # Start timer to update data table
-            self.test_timer = QTimer()
-            self.test_timer.timeout.connect(self._update_test_data)
-            self.test_timer.start(100)  # Update every 100ms
+            # Samples are pulled on the recorder's polling thread; table updates are
+            # coalesced so bursts of samples cause at most one refresh per timer interval
+            self.test_samples_arrived.connect(self._schedule_test_update,
+                                              Qt.ConnectionType.UniqueConnection)
+            samples_connected = True
+            self.test_recorder.start_polling(on_samples=self.test_samples_arrived.emit)
             
             self.is_testing = True
             self.test_button.setText("Receiving...")
             self.test_button.setEnabled(False)
             self.stop_test_button.setEnabled(True)
-                logger.info("LSL test receiver started successfully")
+            logger.info("LSL test receiver started successfully")
             
             # Clear data table
-            self.data_table.setRowCount(0)
+            self.data_model.clear()
+            self._test_positions = None
             
         except Exception as e:
             logger.error(f"Failed to start test: {e}", exc_info=True)
             QMessageBox.warning(self, "Error", f"Failed to start test: {e}")
+            # Undo the connection here; _stop_test() only disconnects while testing
+            if samples_connected:
+                self.test_samples_arrived.disconnect(self._schedule_test_update)
+            self.is_testing = False
             if self.test_recorder:
                 try:
                     self.test_recorder.stop_recording()
@@ -604,12 +799,14 @@ class LSLStreamManagerDialog(QDialog):
     
     def _stop_test(self):
         """Stop stream testing mode."""
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info("Stopping LSL test receiver")
-        if self.test_timer:
-            self.test_timer.stop()
-            self.test_timer = None
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.info("Stopping LSL test receiver")
+        if self.test_recorder:
+            self.test_recorder.stop_polling()
+        if self.is_testing:
+            self.test_samples_arrived.disconnect(self._schedule_test_update)
+        self.test_timer.stop()
         
         if self.test_recorder:
             try:
@@ -621,49 +818,44 @@ class LSLStreamManagerDialog(QDialog):
         self.is_testing = False
         self.test_button.setText("Start Receiving Test")
         self.test_button.setEnabled(True)
-            logger.info("LSL test receiver stopped")
         self.stop_test_button.setEnabled(False)
+        logger.info("LSL test receiver stopped")
+    
+    def _schedule_test_update(self):
+        """Refresh the data table soon, unless a refresh is already pending.
+        
+        Recording continues regardless; while the dialog is hidden or minimized
+        the table is not refreshed at all (it catches up when shown again), and
+        while another window is active it is refreshed less often.
+        """
+        if not self.test_recorder or self.test_timer.isActive():
+            return
+        if not self.isVisible() or self.isMinimized():
+            return
+        self.test_timer.start(TEST_TABLE_REFRESH_MS if self.isActiveWindow()
+                              else TEST_TABLE_INACTIVE_REFRESH_MS)
     
     def _update_test_data(self):
-        """Update the received data table during testing."""
+        """Append newly received samples to the data table during testing."""
         if not self.test_recorder or not self.test_recorder.is_recording:
             return
         
-        # Record a sample
-        self.test_recorder.record_sample()
-        
-        # Update table with recent samples (last 50)
-        recent_samples = self.test_recorder.recorded_data[-50:]
-        
-        self.data_table.setRowCount(len(recent_samples))
+        # Only samples that arrived since the last tick are added to the table
+        new_samples, self._test_positions = self.test_recorder.get_samples_since(
+            self._test_positions, TEST_TABLE_MAX_ROWS
+        )
+        if not new_samples:
+            return
         
-        for i, sample in enumerate(recent_samples):
-            relative_time = sample.get('relative_time', 0.0)
-            stream_info = sample.get('stream_info', {})
-            stream_name = stream_info.get('name', 'Unknown')
-            data = sample.get('data', [])
-            
-            # Format data
-            if isinstance(data, list):
-                data_str = ', '.join([str(d) for d in data[:5]])  # Show first 5 values
-                if len(data) > 5:
-                    data_str += f" ... ({len(data)} total)"
-            else:
-                data_str = str(data)
-            
-            self.data_table.setItem(i, 0, QTableWidgetItem(f"{relative_time:.3f}s"))
-            self.data_table.setItem(i, 1, QTableWidgetItem(stream_name))
-            self.data_table.setItem(i, 2, QTableWidgetItem(str(len(data) if isinstance(data, list) else 1)))
-            self.data_table.setItem(i, 3, QTableWidgetItem(data_str[:100]))  # Truncate long data
+        self.data_model.append_samples(new_samples)
         
         # Scroll to bottom
-        if recent_samples:
-            self.data_table.scrollToBottom()
+        self.data_table.scrollToBottom()
     
     def _save_config(self):
         """Save the configuration."""
         # Update config from UI
-        self._on_config_changed()
+        self._apply_config_changes()
         # Persist selected streams into additional_stream_filters so recording will include them
         try:
             self.current_config.additional_stream_filters = list(self.selected_streams)
@@ -679,9 +871,20 @@ class LSLStreamManagerDialog(QDialog):
     
     def get_config(self) -> LSLConfig:
         """Get the current configuration."""
-        self._on_config_changed()
+        self._apply_config_changes()
         return self.current_config
     
+    def showEvent(self, event):
+        """Catch up on samples received while the dialog was hidden."""
+        super().showEvent(event)
+        self._schedule_test_update()
+    
+    def changeEvent(self, event):
+        """Catch up on samples received while the dialog was minimized or inactive."""
+        super().changeEvent(event)
+        if event.type() in (QEvent.Type.WindowStateChange, QEvent.Type.ActivationChange):
+            self._schedule_test_update()
+    
     def closeEvent(self, event):
         """Handle dialog close event."""
         if self.is_testing:
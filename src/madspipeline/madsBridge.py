@@ -12,6 +12,12 @@ except ImportError:
     LSL_AVAILABLE = False
     local_clock = None
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # Raises orjson.JSONDecodeError, a json.JSONDecodeError subclass
+except ImportError:
+    _json_loads = json.loads
+
 from PySide6.QtCore import QObject, Slot, Signal
 
 
@@ -23,21 +29,48 @@ class Bridge(QObject):
     
     # Signal for structured events from JavaScript (for LSL streaming)
     event_received = Signal(dict)  # {type, data, timestamp}
+    
+    # Per-type signals, emitted in addition to event_received so consumers that
+    # only care about one event type don't have to filter every event
+    session_end_received = Signal(dict)
+    marker_received = Signal(dict)
 
-    def __init__(self):
+    def __init__(self, echo_events: bool = True):
+        """Initialize the bridge.
+        
+        Args:
+            echo_events: Send an "Event received: <type>" message back to
+                JavaScript for every structured event
+        """
         super().__init__()
+        self.echo_events = echo_events
+        self._type_signals = {
+            'session_end': self.session_end_received,
+            'marker': self.marker_received,
+        }
 
     # Slots -> callable from JS
     @Slot(str)
     def receiveMessage(self, msg: str):
         """Receive a message from JavaScript.
         
+        QWebChannel calls this on the GUI thread, and signals are emitted from
+        here, so slots connected with Qt.DirectConnection run inline on the GUI
+        thread. Slots may therefore touch widgets, but should be quick since
+        every page event waits for them.
+        
         Args:
             msg: Message string (can be JSON or plain text)
         """
+        # Structured events are JSON objects; skip the parser (and its exception)
+        # for anything else
+        if not msg.lstrip().startswith('{'):
+            self.messageFromPython.emit(f"Echo from Python: {msg}")
+            return
+        
         try:
             # Try to parse as JSON for structured events
-            event_data = json.loads(msg)
+            event_data = _json_loads(msg)
             
             # Validate event structure
             if isinstance(event_data, dict) and 'type' in event_data:
@@ -55,9 +88,13 @@ class Bridge(QObject):
                 
                 # Emit structured event signal for LSL streaming
                 self.event_received.emit(event_data)
+                type_signal = self._type_signals.get(event_data['type'])
+                if type_signal is not None:
+                    type_signal.emit(event_data)
                 
                 # Also emit plain message for backward compatibility
-                self.messageFromPython.emit(f"Event received: {event_data.get('type', 'unknown')}")
+                if self.echo_events:
+                    self.messageFromPython.emit(f"Event received: {event_data['type']}")
             else:
                 # Not a structured event, treat as plain message
                 self.messageFromPython.emit(f"Echo from Python: {msg}")
@@ -1,9 +1,12 @@
 import sys
+import codecs
 import logging
 import os
+import queue
 import threading
 from datetime import datetime
 from pathlib import Path
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 
 # Ensure package root (src) is on sys.path when running this file directly
@@ -14,6 +17,35 @@ if str(_package_root) not in sys.path:
 # Import via package so relative imports in submodules work
 from madspipeline.main_window import MainWindow
 
+class StreamToLogger:
+    """File-like object that forwards complete lines written to it to a logger."""
+
+    def __init__(self, logger, level=logging.INFO):
+        self.logger = logger
+        self.level = level
+        self._buf = []
+
+    def write(self, buf):
+        if not buf:
+            return 0
+        self._buf.append(buf)
+        if '\n' in buf:
+            lines = ''.join(self._buf).split('\n')
+            self._buf = [lines[-1]] if lines[-1] else []
+            if self.logger.isEnabledFor(self.level):
+                for line in lines[:-1]:
+                    if line.strip():
+                        self.logger.log(self.level, line.rstrip())
+        return len(buf)
+
+    def flush(self):
+        if self._buf:
+            line = ''.join(self._buf)
+            self._buf = []
+            if line.strip() and self.logger.isEnabledFor(self.level):
+                self.logger.log(self.level, line.rstrip())
+
+
 def main():
     # Configure logging: write to console and per-launch log file in `logs/`
     try:
@@ -47,52 +79,79 @@ def main():
             os.dup2(w_fd, 1)
             os.dup2(w_fd, 2)
 
+            # Console logging must bypass the pipe, otherwise every logged line
+            # would be read back and logged again
+            ch.setStream(os.fdopen(os.dup(orig_stdout_fd), 'w', buffering=1,
+                                   encoding='utf-8', errors='replace'))
+
             # Open a binary file handle for the log file to write native bytes
             log_file_bin = open(log_file, 'ab', buffering=0)
 
-            def _reader_thread(fd, orig_out_fd, logger_instance):
+            # Raw chunks waiting to be decoded and logged (bounded: the reader
+            # blocks, and so back-pressures native writers, if logging falls behind)
+            native_chunks = queue.Queue(maxsize=256)
+
+            def _reader_thread(fd, orig_out_fd):
                 """Read from pipe and write bytes to both original stdout and log file."""
+                buf = bytearray(65536)
+                view = memoryview(buf)
                 try:
-                    with os.fdopen(fd, 'rb', closefd=True) as reader:
+                    with os.fdopen(fd, 'rb', buffering=0, closefd=True) as reader:
                         while True:
-                            chunk = reader.read(1024)
-                            if not chunk:
+                            n = reader.readinto(buf)
+                            if not n:
                                 break
+                            chunk = view[:n]
                             # Write to original console
                             try:
                                 os.write(orig_out_fd, chunk)
                             except Exception:
                                 pass
-                            # Also write to the log file (binary)
+                            # Also write to the log file (binary, unbuffered)
                             try:
                                 log_file_bin.write(chunk)
-                                log_file_bin.flush()
-                            except Exception:
-                                pass
-                            # Also log decoded text via logging to keep consistency
-                            try:
-                                text = chunk.decode('utf-8', errors='replace')
-                                for line in text.rstrip().splitlines():
-                                    logger_instance.info(line)
                             except Exception:
                                 pass
+                            # Decoding and logging happen on the logger thread
+                            native_chunks.put(bytes(chunk))
                 except Exception:
                     pass
-
-            # Start reader thread to tee pipe contents
-            t = threading.Thread(target=_reader_thread, args=(r_fd, orig_stdout_fd, logger), daemon=True)
+                finally:
+                    native_chunks.put(None)
+
+            def _logger_thread(logger_instance):
+                """Log decoded text via logging to keep consistency."""
+                # Lines split across chunks are logged once complete
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                stream = StreamToLogger(logger_instance)
+                while True:
+                    chunk = native_chunks.get()
+                    if chunk is None:
+                        break
+                    try:
+                        stream.write(decoder.decode(chunk))
+                    except Exception:
+                        pass
+                stream.flush()
+
+            # Start reader thread to tee pipe contents, and a second one to log them
+            t = threading.Thread(target=_reader_thread, args=(r_fd, orig_stdout_fd), daemon=True)
             t.start()
+            threading.Thread(target=_logger_thread, args=(logger,), daemon=True).start()
 
         except Exception:
             # If FD-level redirect fails, fall back to Python-level redirection
-            sys.stdout = logging.StreamHandler(sys.__stdout__)
-            sys.stderr = logging.StreamHandler(sys.__stderr__)
+            sys.stdout = StreamToLogger(logging.getLogger('stdout'), logging.INFO)
+            sys.stderr = StreamToLogger(logging.getLogger('stderr'), logging.ERROR)
 
         logging.info("Starting MadsPipeline")
     except Exception:
         # Do not fail startup purely because logging setup had an unexpected error
         pass
 
+    # QtWebEngine is imported lazily by the embedded webpage session, after the
+    # application exists, so the shared GL context it needs must be requested up front
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     
     # Set application properties
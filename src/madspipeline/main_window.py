@@ -2,33 +2,37 @@
 Main application window for MadsPipeline.
 """
 import sys
+import functools
+import importlib.util
+import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
-# Try to import cv2 for video playback (optional dependency)
-try:
-    import cv2
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
-    cv2 = None
+import numpy as np
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QListWidget, QListWidgetItem,
-    QDialog, QLineEdit, QTextEdit, QFormLayout, QMessageBox,
-    QStackedWidget, QFrame, QScrollArea, QGridLayout,
+    QPushButton, QLabel, QListWidget, QListWidgetItem, QListView,
+    QDialog, QLineEdit, QTextEdit, QPlainTextEdit, QFormLayout, QMessageBox,
+    QStackedWidget, QScrollArea, QGridLayout,
     QSplitter, QGroupBox, QFileDialog, QComboBox, QCheckBox,
     QSpinBox, QDoubleSpinBox, QSlider, QTableWidget, QTableWidgetItem,
-    QHeaderView, QAbstractItemView, QGraphicsView, QGraphicsScene,
-    QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem,
+    QAbstractItemView, QGraphicsView, QGraphicsScene,
+    QGraphicsEllipseItem, QGraphicsLineItem,
     QApplication, QToolTip, QRadioButton, QButtonGroup
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QSize, QUrl, QPointF, QRectF
-from PySide6.QtGui import QFont, QIcon, QPixmap, QColor, QPen, QBrush, QPainter, QWheelEvent, QCursor
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebEngineCore import QWebEngineSettings, QWebEnginePage, QWebEngineProfile
-from PySide6.QtWebChannel import QWebChannel
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QSize, QUrl, QSignalBlocker,
+    QPoint, QRect, QLineF, QEvent
+)
+from PySide6.QtGui import (
+    QFont, QIcon, QImage, QPixmap, QColor, QPen, QBrush, QPainter, QPainterPath, QWheelEvent, QCursor
+)
+
+# QtWebEngine pulls in the Chromium runtime, so it is only imported once an
+# embedded webpage session is actually opened
+WEBENGINE_AVAILABLE = importlib.util.find_spec("PySide6.QtWebEngineWidgets") is not None
 
 try:
     import matplotlib
@@ -43,33 +47,63 @@ except ImportError:
     Figure = None
 
 
-class ConsoleLoggingWebPage(QWebEnginePage):
-    """Custom QWebEnginePage that forwards JavaScript console messages to Python print."""
+@functools.lru_cache(maxsize=None)
+def _console_logging_web_page_class():
+    """Define ConsoleLoggingWebPage on first use so QtWebEngine is imported lazily."""
+    import logging
+    import queue
+    import threading
+    from PySide6.QtWebEngineCore import QWebEnginePage
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
+    logger = logging.getLogger(__name__)
+    
+    # Console messages are logged from a background thread so a chatty page
+    # never blocks the GUI thread on log I/O; the backlog is bounded by dropping
+    log_queue = queue.SimpleQueue()
     
-    def javaScriptConsoleMessage(self, level: int, message: str, line_number: int, source_id: str):
-        """Override to capture JavaScript console messages.
+    def drain_log_queue():
+        while True:
+            # Format: [JS-LEVEL] source:line - message
+            logger.info("[%s] %s:%s - %s", *log_queue.get())
+    
+    threading.Thread(target=drain_log_queue, name="js-console-log", daemon=True).start()
+    
+    class ConsoleLoggingWebPage(QWebEnginePage):
+        """Custom QWebEnginePage that forwards JavaScript console messages to the Python log."""
         
-        Args:
-            level: Message level (0=Info, 1=Warning, 2=Error)
-            message: Console message text
-            line_number: Line number in source
-            source_id: Source file/URL
-        """
-        level_names = {
+        _LOG_QUEUE_MAX = 1024
+        
+        _LEVEL_NAMES = {
             QWebEnginePage.JavaScriptConsoleMessageLevel.InfoMessageLevel: "JS-INFO",
             QWebEnginePage.JavaScriptConsoleMessageLevel.WarningMessageLevel: "JS-WARN",
             QWebEnginePage.JavaScriptConsoleMessageLevel.ErrorMessageLevel: "JS-ERROR"
         }
-        level_name = level_names.get(level, "JS-UNKNOWN")
         
-        # Format: [JS-LEVEL] source:line - message
-        print(f"[{level_name}] {source_id}:{line_number} - {message}")
+        def __init__(self, parent=None):
+            super().__init__(parent)
         
-        # Call parent method to maintain default behavior
-        super().javaScriptConsoleMessage(level, message, line_number, source_id)
+        def javaScriptConsoleMessage(self, level: int, message: str, line_number: int, source_id: str):
+            """Override to capture JavaScript console messages.
+            
+            Args:
+                level: Message level (0=Info, 1=Warning, 2=Error)
+                message: Console message text
+                line_number: Line number in source
+                source_id: Source file/URL
+            """
+            level_name = self._LEVEL_NAMES.get(level, "JS-UNKNOWN")
+            
+            if log_queue.qsize() < self._LOG_QUEUE_MAX:
+                log_queue.put((level_name, source_id, line_number, message))
+            
+            # Keep Qt's default handling for warnings and errors; it does its own
+            # I/O, so plain info messages skip it
+            if level != QWebEnginePage.JavaScriptConsoleMessageLevel.InfoMessageLevel:
+                super().javaScriptConsoleMessage(level, message, line_number, source_id)
+    
+    return ConsoleLoggingWebPage
+
+
 import json
 
 # Import local modules using absolute imports for direct execution
@@ -79,6 +113,177 @@ from .madsBridge import Bridge
 from .lsl_integration import LSLBridgeStreamer, LSLMouseTrackingStreamer, LSLRecorder, LSL_AVAILABLE
 from .screen_recorder import ScreenRecorder, RECORDING_AVAILABLE
 from .lsl_manager import LSLStreamManagerDialog
+from .background_task import BackgroundTask, TaskSignals, start_background_task
+
+
+# Icon file for each project type, looked up in the icons directory
+_PROJECT_TYPE_ICONS = {
+    ProjectType.PICTURE_SLIDESHOW: "picture_slideshow.svg",
+    ProjectType.VIDEO: "video.svg",
+    ProjectType.SCREEN_RECORDING: "screen_recording.svg",
+    ProjectType.EMBEDDED_WEBPAGE: "embedded_webpage_fixed.svg"
+}
+
+# Size project type icons are shown (and pre-rendered) at in the project list
+_PROJECT_ICON_SIZE = QSize(48, 48)
+
+
+# Display name for each project type, e.g. "Picture Slideshow"
+_PROJECT_TYPE_DISPLAY = {pt: pt.value.replace('_', ' ').title() for pt in ProjectType}
+
+# Icons directory, resolved once at import (first of the candidates that exists)
+_ICONS_DIR = next((p for p in (
+    Path(__file__).resolve().parent.parent / "icons",  # From main_window.py
+    Path.cwd() / "src" / "icons",                      # From current working directory
+    Path(__file__).resolve().parent / "icons"          # From madspipeline directory
+) if p.is_dir()), None)
+
+
+# cv2 is used for video playback (optional dependency). OpenCV is large, so it
+# is imported by _get_cv2() when a session video is first loaded; until then
+# CV2_AVAILABLE is None (unknown)
+cv2 = None
+CV2_AVAILABLE: Optional[bool] = None
+
+
+def _get_cv2():
+    """Import cv2 on first use. Returns the module, or None if OpenCV is not installed."""
+    global cv2, CV2_AVAILABLE
+    if CV2_AVAILABLE is None:
+        try:
+            import cv2 as _cv2
+        except ImportError:
+            _cv2 = None
+        cv2 = _cv2
+        CV2_AVAILABLE = _cv2 is not None
+    return cv2
+
+
+@functools.lru_cache(maxsize=32)
+def _font(family: str, size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+    """Shared QFont so each label style is only matched against system fonts once."""
+    return QFont(family, size, weight)
+
+
+def _browse_row(*widgets: QWidget) -> QHBoxLayout:
+    """Lay out a form row's widgets (e.g. a path edit and its Browse button) side by side."""
+    row = QHBoxLayout()
+    for widget in widgets:
+        row.addWidget(widget)
+    return row
+
+
+def _format_datetime(d: datetime) -> str:
+    """Format as "YYYY-MM-DD HH:MM" (same as strftime("%Y-%m-%d %H:%M"), without the format parser)."""
+    return f"{d.year}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+
+
+# Shared stylesheets for hint/placeholder labels
+_HINT_CSS = "color: gray; font-style: italic;"
+_HINT_SMALL_CSS = _HINT_CSS + " font-size: 10px;"
+
+
+# Minimum time between debug canvas repaints while the mouse moves (~60 Hz)
+_CANVAS_REPAINT_INTERVAL_MS = 16
+# Moves closer than this (in pixels, on either axis) to the last trail vertex
+# are recorded but not added to the drawn trail
+_TRAIL_MIN_STEP_PX = 2
+
+
+def _store_row(rows: np.ndarray, n: int, row) -> np.ndarray:
+    """Store row at index n of a preallocated array, doubling the array when it is full.
+    
+    Returns the array to keep using (a new one if it had to grow).
+    """
+    if n == len(rows):
+        grown = np.empty((2 * n,) + rows.shape[1:], dtype=rows.dtype)
+        grown[:n] = rows
+        rows = grown
+    rows[n] = row
+    return rows
+
+
+# Names used for clicks in the debug session's live data feed (anything else is "Middle")
+_MOUSE_BUTTON_NAMES = {
+    Qt.MouseButton.LeftButton: "Left",
+    Qt.MouseButton.RightButton: "Right",
+}
+
+# Debug session record button styles (green to start, red to stop)
+_RECORD_START_CSS = "QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }"
+_RECORD_STOP_CSS = "QPushButton { background-color: #f44336; color: white; font-weight: bold; }"
+
+# Lines kept in the debug session's live data feed; older lines are dropped
+_LIVE_FEED_MAX_LINES = 500
+
+# Size limit of the embedded webpage HTTP cache
+_WEB_HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Shown in embedded webpage sessions when the project has no webpage
+_NO_WEBPAGE_HTML = """
+<html>
+<body style="font-family: Arial, sans-serif; text-align: center; padding: 50px;">
+    <h2>No Webpage Configured</h2>
+    <p>Please configure a webpage URL or local HTML file in the project settings.</p>
+</body>
+</html>
+"""
+
+# Run when an embedded webpage session ends, to stop the stimulus video
+_STOP_VIDEO_JS = """
+(function() {
+    const video = document.getElementById('attentionVideo');
+    if (video) {
+        video.pause();
+        video.currentTime = 0;
+        video.muted = true;
+        // Remove source to completely stop playback
+        video.src = '';
+        video.load();
+    }
+})();
+"""
+
+# How long the mouse must be still before an embedded webpage session polls the cursor
+_CURSOR_IDLE_S = 0.5
+
+# How often queued mouse samples of an embedded webpage session are pushed to LSL
+_MOUSE_FLUSH_INTERVAL_MS = 50
+
+# Number of sessions listed under Recent Sessions on the project dashboard
+_RECENT_SESSIONS_SHOWN = 5
+
+# Style of the session rows (label and delete button), applied to the Recent Sessions group
+_SESSION_ROW_CSS = """
+    QLabel#sessionInfoLabel {
+        padding: 5px;
+    }
+    QPushButton#deleteSessionButton {
+        background-color: #ff4444;
+        color: white;
+        border: none;
+        border-radius: 15px;
+        font-size: 12px;
+    }
+    QPushButton#deleteSessionButton:hover {
+        background-color: #cc0000;
+    }
+"""
+
+
+# File dialog filters for the project config browse buttons
+_IMAGE_FILTER = "Image Files (*.png *.jpg *.jpeg *.bmp *.gif)"
+_VIDEO_FILTER = "Video Files (*.mp4 *.avi *.mov *.mkv)"
+_HTML_FILTER = "HTML Files (*.html *.htm)"
+
+
+# Mouse event handlers of EmbeddedWebpageSessionWindow.eventFilter, by event type
+_TRACKED_MOUSE_EVENTS = {
+    QEvent.Type.MouseButtonPress: '_on_mouse_press',
+    QEvent.Type.MouseButtonRelease: '_on_mouse_release',
+    QEvent.Type.MouseMove: '_on_mouse_move',
+    QEvent.Type.Wheel: '_on_wheel_event',
+}
 
 
 class ProjectCreationDialog(QDialog):
@@ -120,11 +325,9 @@ class ProjectCreationDialog(QDialog):
         self.type_combo.addItem("Video", ProjectType.VIDEO)
         self.type_combo.addItem("Screen Recording", ProjectType.SCREEN_RECORDING)
         self.type_combo.addItem("Embedded Webpage", ProjectType.EMBEDDED_WEBPAGE)
-        self.type_combo.currentIndexChanged.connect(self._on_type_changed)
         form_layout.addRow("Project Type:", self.type_combo)
         
         # Location selection
-        location_layout = QHBoxLayout()
         self.location_edit = QLineEdit()
         self.location_edit.setPlaceholderText("Default location (Documents/MadsPipeline)")
         self.location_edit.setReadOnly(True)
@@ -132,15 +335,13 @@ class ProjectCreationDialog(QDialog):
         self.browse_button = QPushButton("Browse...")
         self.browse_button.clicked.connect(self._browse_location)
         
-        location_layout.addWidget(self.location_edit)
-        location_layout.addWidget(self.browse_button)
-        form_layout.addRow("Location:", location_layout)
+        form_layout.addRow("Location:", _browse_row(self.location_edit, self.browse_button))
         
         layout.addLayout(form_layout)
         
         # Note about configuration
         config_note = QLabel("Note: Project-specific settings can be configured after creation in the project view.")
-        config_note.setStyleSheet("color: gray; font-style: italic; font-size: 10px;")
+        config_note.setStyleSheet(_HINT_SMALL_CSS)
         config_note.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(config_note)
         
@@ -159,10 +360,6 @@ class ProjectCreationDialog(QDialog):
         layout.addLayout(button_layout)
         self.setLayout(layout)
     
-    def _on_type_changed(self):
-        """Handle project type change."""
-        self.project_type = self.type_combo.currentData()
-    
     def _browse_location(self):
         """Browse for custom project location."""
         location = QFileDialog.getExistingDirectory(
@@ -186,6 +383,7 @@ class ProjectCreationDialog(QDialog):
         
         self.project_name = name
         self.project_description = description
+        self.project_type = self.type_combo.currentData()
         
         self.accept()
     
@@ -198,6 +396,9 @@ class ProjectCreationDialog(QDialog):
 class EditProjectDialog(QDialog):
     """Dialog for editing existing projects."""
     
+    # Shared across dialog instances so browsing resumes where it left off
+    _last_browse_dir: Optional[str] = None
+    
     def __init__(self, project: Project, parent=None):
         super().__init__(parent)
         self.project = project
@@ -232,8 +433,8 @@ class EditProjectDialog(QDialog):
         form_layout.addRow("Description:", self.description_edit)
         
         # Project type (read-only, can't change after creation)
-        type_label = QLabel(self.project_type.value.replace('_', ' ').title())
-        type_label.setStyleSheet("color: gray; font-style: italic;")
+        type_label = QLabel(_PROJECT_TYPE_DISPLAY[self.project_type])
+        type_label.setStyleSheet(_HINT_CSS)
         form_layout.addRow("Project Type:", type_label)
         
         layout.addLayout(form_layout)
@@ -264,10 +465,15 @@ class EditProjectDialog(QDialog):
     
     def _setup_type_config_ui(self):
         """Set up type-specific configuration UI."""
-        # Clear existing config UI
-        while self.config_layout.rowCount() > 0:
-            self.config_layout.removeRow(0)
-        
+        # Clear existing config UI by swapping in a fresh form widget
+        # (one replace instead of a removeRow() per row)
+        if self.config_layout.rowCount() > 0:
+            old_widget = self.config_widget
+            self.config_widget = QWidget()
+            self.config_layout = QFormLayout(self.config_widget)
+            self.layout().replaceWidget(old_widget, self.config_widget)
+            old_widget.deleteLater()
+
         if self.project_type == ProjectType.PICTURE_SLIDESHOW:
             self._setup_picture_slideshow_config()
         elif self.project_type == ProjectType.VIDEO:
@@ -299,14 +505,11 @@ class EditProjectDialog(QDialog):
         
         # Add image management
         self.images_label = QLabel("No images selected")
-        self.images_label.setStyleSheet("color: gray; font-style: italic;")
+        self.images_label.setStyleSheet(_HINT_CSS)
         self.add_images_button = QPushButton("Add Images...")
         self.add_images_button.clicked.connect(self._add_images)
         
-        images_layout = QHBoxLayout()
-        images_layout.addWidget(self.images_label)
-        images_layout.addWidget(self.add_images_button)
-        self.config_layout.addRow("Images:", images_layout)
+        self.config_layout.addRow("Images:", _browse_row(self.images_label, self.add_images_button))
     
     def _setup_video_config(self):
         """Set up video configuration UI."""
@@ -317,10 +520,7 @@ class EditProjectDialog(QDialog):
         self.video_browse_button = QPushButton("Browse...")
         self.video_browse_button.clicked.connect(self._browse_video)
         
-        video_path_layout = QHBoxLayout()
-        video_path_layout.addWidget(self.video_path_edit)
-        video_path_layout.addWidget(self.video_browse_button)
-        self.config_layout.addRow("Video File:", video_path_layout)
+        self.config_layout.addRow("Video File:", _browse_row(self.video_path_edit, self.video_browse_button))
         
         self.video_auto_play_check = QCheckBox()
         self.video_auto_play_check.setChecked(True)
@@ -364,10 +564,7 @@ class EditProjectDialog(QDialog):
         self.html_browse_button = QPushButton("Browse...")
         self.html_browse_button.clicked.connect(self._browse_html)
         
-        html_layout = QHBoxLayout()
-        html_layout.addWidget(self.local_html_edit)
-        html_layout.addWidget(self.html_browse_button)
-        self.config_layout.addRow("Local HTML:", html_layout)
+        self.config_layout.addRow("Local HTML:", _browse_row(self.local_html_edit, self.html_browse_button))
         
         self.marker_api_check = QCheckBox()
         self.marker_api_check.setChecked(True)
@@ -402,15 +599,22 @@ class EditProjectDialog(QDialog):
         self.normalize_coords_check.setChecked(True)
         self.config_layout.addRow("Normalize Mouse Coordinates:", self.normalize_coords_check)
         
+        # Cursor polling while the mouse is idle (mouse events are always tracked)
+        self.poll_cursor_check = QCheckBox()
+        self.poll_cursor_check.setToolTip("Also record the cursor position at 10 Hz while the mouse is not moving")
+        self.config_layout.addRow("Poll Cursor When Idle:", self.poll_cursor_check)
+        
         # Initialize state
         self._on_fullscreen_toggled()
     
     def _add_images(self):
         """Add images to the slideshow."""
         file_paths, _ = QFileDialog.getOpenFileNames(
-            self, "Select Images", "", "Image Files (*.png *.jpg *.jpeg *.bmp *.gif)"
+            self, "Select Images", self._browse_dir(), _IMAGE_FILTER,
+            options=QFileDialog.Option.ReadOnly
         )
         if file_paths:
+            self._remember_browse_dir(file_paths[0])
             # Update the images label
             if len(file_paths) == 1:
                 self.images_label.setText(f"1 image selected")
@@ -418,20 +622,32 @@ class EditProjectDialog(QDialog):
                 self.images_label.setText(f"{len(file_paths)} images selected")
             self.images_label.setStyleSheet("color: black; font-style: normal;")
     
+    def _browse_dir(self) -> str:
+        """Start directory for the browse dialogs (last used, else Qt's default)."""
+        return EditProjectDialog._last_browse_dir or ""
+    
+    def _remember_browse_dir(self, file_path: str):
+        """Reopen the browse dialogs in the directory of the last picked file."""
+        EditProjectDialog._last_browse_dir = str(Path(file_path).parent)
+    
     def _browse_video(self):
         """Browse for video file."""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Video File", "", "Video Files (*.mp4 *.avi *.mov *.mkv)"
+            self, "Select Video File", self._browse_dir(), _VIDEO_FILTER,
+            options=QFileDialog.Option.ReadOnly
         )
         if file_path:
+            self._remember_browse_dir(file_path)
             self.video_path_edit.setText(file_path)
     
     def _browse_html(self):
         """Browse for HTML file."""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select HTML File", "", "HTML Files (*.html *.htm)"
+            self, "Select HTML File", self._browse_dir(), _HTML_FILTER,
+            options=QFileDialog.Option.ReadOnly
         )
         if file_path:
+            self._remember_browse_dir(file_path)
             self.local_html_edit.setText(file_path)
     
     def _on_fullscreen_toggled(self):
@@ -474,11 +690,14 @@ class EditProjectDialog(QDialog):
             if config.local_html_path:
                 self.local_html_edit.setText(str(config.local_html_path))
             self.marker_api_check.setChecked(config.enable_marker_api)
-            self.enforce_fullscreen_check.setChecked(config.enforce_fullscreen if hasattr(config, 'enforce_fullscreen') else False)
+            # The toggled slot is run once below, after all fields are loaded
+            with QSignalBlocker(self.enforce_fullscreen_check):
+                self.enforce_fullscreen_check.setChecked(config.enforce_fullscreen)
             if config.window_size:
                 self.window_width_spin.setValue(config.window_size[0])
                 self.window_height_spin.setValue(config.window_size[1])
-            self.normalize_coords_check.setChecked(config.normalize_mouse_coordinates if hasattr(config, 'normalize_mouse_coordinates') else True)
+            self.normalize_coords_check.setChecked(config.normalize_mouse_coordinates)
+            self.poll_cursor_check.setChecked(config.poll_cursor_when_idle)
             # Update UI state based on fullscreen setting
             self._on_fullscreen_toggled()
     
@@ -536,7 +755,8 @@ class EditProjectDialog(QDialog):
                 'fullscreen': True,  # Keep for backward compatibility
                 'window_size': window_size,
                 'enforce_fullscreen': self.enforce_fullscreen_check.isChecked(),
-                'normalize_mouse_coordinates': self.normalize_coords_check.isChecked()
+                'normalize_mouse_coordinates': self.normalize_coords_check.isChecked(),
+                'poll_cursor_when_idle': self.poll_cursor_check.isChecked()
             })
         
         return config
@@ -548,9 +768,23 @@ class ProjectSelectionWidget(QWidget):
     project_selected = Signal(Project)
     project_created = Signal(Project)
     
+    # Project type icons, shared by all instances
+    _ICON_CACHE: Dict[ProjectType, QIcon] = {}
+    
     def __init__(self, project_manager: ProjectManager, parent=None):
         super().__init__(parent)
         self.project_manager = project_manager
+        
+        # Projects are loaded in the background; a refresh requested while a
+        # load is running is queued so it sees any project created meanwhile
+        self._load_task: Optional[BackgroundTask] = None
+        self._reload_requested = False
+        # List items by project path, with the modified_date they were built from
+        self._item_cache: Dict[Path, Tuple[datetime, QListWidgetItem]] = {}
+        self._load_signals = TaskSignals(self)
+        self._load_signals.succeeded.connect(self._populate_project_list)
+        self._load_signals.failed.connect(self._on_projects_load_failed)
+        
         self._setup_ui()
         self._refresh_projects()
     
@@ -560,7 +794,7 @@ class ProjectSelectionWidget(QWidget):
         
         # Header
         header = QLabel("MadsPipeline - Project Selection")
-        header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        header.setFont(_font("Arial", 16, QFont.Weight.Bold))
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(header)
         
@@ -572,7 +806,13 @@ class ProjectSelectionWidget(QWidget):
         self.project_list.itemDoubleClicked.connect(self._on_project_selected)
         
         # Set icon size to make icons larger (default is usually 16x16, so 48x48 is about 3x)
-        self.project_list.setIconSize(QSize(48, 48))
+        self.project_list.setIconSize(_PROJECT_ICON_SIZE)
+        
+        # Every item is an icon plus three text lines, so one size hint fits all
+        self.project_list.setUniformItemSizes(True)
+        self.project_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.project_list.setBatchSize(64)
+        self.project_list.setResizeMode(QListView.ResizeMode.Adjust)
         
         list_layout.addWidget(self.project_list)
         
@@ -604,59 +844,118 @@ class ProjectSelectionWidget(QWidget):
         self.setLayout(layout)
     
     def _get_project_type_icon(self, project_type: ProjectType) -> QIcon:
-        """Get the appropriate icon for a project type."""
-        # Try multiple path resolution methods
-        possible_paths = [
-            Path(__file__).parent.parent / "icons",  # From main_window.py
-            Path.cwd() / "src" / "icons",           # From current working directory
-            Path(__file__).parent / "icons"         # From madspipeline directory
-        ]
-        
-        icon_mapping = {
-            ProjectType.PICTURE_SLIDESHOW: "picture_slideshow.svg",
-            ProjectType.VIDEO: "video.svg", 
-            ProjectType.SCREEN_RECORDING: "screen_recording.svg",
-            ProjectType.EMBEDDED_WEBPAGE: "embedded_webpage_fixed.svg"
-        }
-        
-        icon_filename = icon_mapping.get(project_type)
-        if icon_filename:
-            # Try each possible path
-            for icons_dir in possible_paths:
-                icon_path = icons_dir / icon_filename
-                if icon_path.exists():
-                    return QIcon(str(icon_path))
-        
-        # Return empty icon if file doesn't exist
-        return QIcon()
+        """Get the appropriate icon for a project type (rendered once per type)."""
+        icon = self._ICON_CACHE.get(project_type)
+        if icon is not None:
+            return icon
+        
+        icon = QIcon()  # Empty icon if file doesn't exist
+        icon_filename = _PROJECT_TYPE_ICONS.get(project_type)
+        if icon_filename and _ICONS_DIR:
+            icon_path = _ICONS_DIR / icon_filename
+            if icon_path.exists():
+                # Render the SVG once at list size so painting never rasterizes it again
+                icon = QIcon(QIcon(str(icon_path)).pixmap(_PROJECT_ICON_SIZE))
+        
+        self._ICON_CACHE[project_type] = icon
+        return icon
 
     def _refresh_projects(self):
-        """Refresh the project list."""
+        """Refresh the project list.
+        
+        Project metadata is read on a thread pool thread so the window stays
+        responsive; the list is filled in when the result arrives.
+        """
         import logging
         logger = logging.getLogger(__name__)
+        
+        if self._load_task is not None:
+            self._reload_requested = True
+            return
+        
         logger.info("Refreshing project list")
+        if self.project_list.count() == 0:
+            placeholder = QListWidgetItem("Loading projects...")
+            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.project_list.addItem(placeholder)
+        
+        self.refresh_button.setEnabled(False)
+        self._load_task = start_background_task(self.project_manager.list_projects, self._load_signals)
+    
+    def _finish_load(self) -> bool:
+        """Clear the running load; start a queued one. Returns True if one was started."""
+        self._load_task = None
+        self.refresh_button.setEnabled(True)
+        if self._reload_requested:
+            self._reload_requested = False
+            self._refresh_projects()
+            return True
+        return False
+    
+    def _populate_project_list(self, projects: List[Project]):
+        """Show the projects loaded by a background refresh."""
+        import logging
+        logger = logging.getLogger(__name__)
         
-        self.project_list.clear()
+        if self._finish_load():
+            # A newer load is running; show its result instead
+            return
+        logger.info(f"Found {len(projects)} projects")
         
+        project_list = self.project_list
+        item_cache = self._item_cache
+        project_list.setUpdatesEnabled(False)
+        project_list.blockSignals(True)
         try:
-            projects = self.project_manager.list_projects()
-            logger.info(f"Found {len(projects)} projects")
+            # Drop items of projects that are gone (and the loading placeholder)
+            live_paths = {project.project_path for project in projects}
+            for path in [path for path in item_cache if path not in live_paths]:
+                _, item = item_cache.pop(path)
+                project_list.takeItem(project_list.row(item))
+            if project_list.count() > len(item_cache):
+                project_list.takeItem(0)
             
+            # Only build text and icons for new or modified projects
+            add_item = project_list.addItem
             for project in projects:
+                cached = item_cache.get(project.project_path)
+                if cached is not None and cached[0] == project.modified_date:
+                    cached[1].setData(Qt.ItemDataRole.UserRole, project)
+                    continue
+                
                 logger.debug(f"Loading project: {project.name} (type: {project.project_type})")
-                item = QListWidgetItem()
-                project_type_display = project.project_type.value.replace('_', ' ').title()
-                item.setText(f"{project.name}\n{project.description}\nType: {project_type_display}")
+                item = cached[1] if cached is not None else QListWidgetItem()
+                project_type_display = _PROJECT_TYPE_DISPLAY[project.project_type]
+                # Only the first description line, so all items stay three lines tall
+                description = project.description.partition('\n')[0]
+                item.setText(f"{project.name}\n{description}\nType: {project_type_display}")
                 item.setData(Qt.ItemDataRole.UserRole, project)
                 
                 # Set the appropriate icon
                 item.setIcon(self._get_project_type_icon(project.project_type))
                 
-                self.project_list.addItem(item)
+                if cached is None:
+                    add_item(item)
+                item_cache[project.project_path] = (project.modified_date, item)
             logger.info(f"Project list refreshed with {len(projects)} projects")
-        except Exception as e:
-            logger.error(f"Failed to load projects: {e}", exc_info=True)
-            QMessageBox.warning(self, "Error", f"Failed to load projects: {e}")
+        finally:
+            project_list.blockSignals(False)
+            project_list.setUpdatesEnabled(True)
+        # Signals were blocked while updating, so sync the selection-dependent button
+        self._on_selection_changed()
+    
+    def _on_projects_load_failed(self, error: str):
+        """Report a failed background project refresh."""
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        if self._finish_load():
+            return
+        logger.error(f"Failed to load projects: {error}")
+        # Drop the loading placeholder, if it is still shown
+        if self.project_list.count() == 1 and self.project_list.item(0).data(Qt.ItemDataRole.UserRole) is None:
+            self.project_list.clear()
+        QMessageBox.warning(self, "Error", f"Failed to load projects: {error}")
     
     def _create_new_project(self):
         """Create a new project."""
@@ -686,7 +985,8 @@ class ProjectSelectionWidget(QWidget):
     def _on_project_selected(self, item):
         """Handle project double-click."""
         project = item.data(Qt.ItemDataRole.UserRole)
-        self.project_selected.emit(project)
+        if project is not None:  # Not the loading placeholder
+            self.project_selected.emit(project)
     
     def _open_selected_project(self):
         """Open the selected project."""
@@ -710,6 +1010,10 @@ class ProjectDashboardWidget(QWidget):
     def __init__(self, project: Project, parent=None):
         super().__init__(parent)
         self.project = project
+        # (row widget, label, delete button) of the recent sessions group, reused across refreshes
+        self._session_rows: List[Tuple[QWidget, QLabel, QPushButton]] = []
+        self._sessions_group: Optional[QGroupBox] = None
+        self._project_manager_owner: Optional[QWidget] = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -720,10 +1024,10 @@ class ProjectDashboardWidget(QWidget):
         header_layout = QHBoxLayout()
         
         back_button = QPushButton("← Back to Projects")
-        back_button.clicked.connect(self.back_to_projects_requested.emit)
+        back_button.clicked.connect(self.back_to_projects_requested)
         
         project_title = QLabel(f"Project: {self.project.name}")
-        project_title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        project_title.setFont(_font("Arial", 14, QFont.Weight.Bold))
         
         header_layout.addWidget(back_button)
         header_layout.addWidget(project_title)
@@ -731,54 +1035,19 @@ class ProjectDashboardWidget(QWidget):
         
         layout.addLayout(header_layout)
         
-        # Project info
+        # Project info; the rows are filled in when the dashboard is first shown
         info_group = QGroupBox("Project Information")
-        info_layout = QFormLayout()
-        
-        info_layout.addRow("Description:", QLabel(self.project.description))
-        info_layout.addRow("Type:", QLabel(self.project.project_type.value.replace('_', ' ').title()))
-        info_layout.addRow("Created:", QLabel(self.project.created_date.strftime("%Y-%m-%d %H:%M")))
-        info_layout.addRow("Modified:", QLabel(self.project.modified_date.strftime("%Y-%m-%d %H:%M")))
-        
-        # Store reference to sessions count label for easy updating
-        self.sessions_count_label = QLabel(str(len(self.project.sessions)))
-        info_layout.addRow("Sessions:", self.sessions_count_label)
-        
-        info_layout.addRow("Location:", QLabel(str(self.project.project_path)))
-        
-        # Add type-specific configuration info
-        if self.project.picture_slideshow_config:
-            config = self.project.picture_slideshow_config
-            info_layout.addRow("Slide Duration:", QLabel(f"{config.slide_duration}s"))
-            info_layout.addRow("Auto-play:", QLabel("Yes" if config.auto_play else "No"))
-            info_layout.addRow("Manual Navigation:", QLabel("Yes" if config.manual_navigation else "No"))
-        elif self.project.video_config:
-            config = self.project.video_config
-            if config.video_path:
-                info_layout.addRow("Video File:", QLabel(config.video_path.name))
-            info_layout.addRow("Auto-play:", QLabel("Yes" if config.auto_play else "No"))
-            info_layout.addRow("Loop:", QLabel("Yes" if config.loop else "No"))
-        elif self.project.screen_recording_config:
-            config = self.project.screen_recording_config
-            info_layout.addRow("Quality:", QLabel(config.recording_quality.title()))
-            info_layout.addRow("FPS:", QLabel(str(config.fps)))
-            info_layout.addRow("Mouse Tracking:", QLabel("Yes" if config.mouse_tracking else "No"))
-        elif self.project.embedded_webpage_config:
-            config = self.project.embedded_webpage_config
-            if config.webpage_url:
-                info_layout.addRow("URL:", QLabel(config.webpage_url))
-            elif config.local_html_path:
-                info_layout.addRow("Local HTML:", QLabel(config.local_html_path.name))
-            info_layout.addRow("Marker API:", QLabel("Enabled" if config.enable_marker_api else "Disabled"))
+        self._info_layout = QFormLayout()
+        self._info_rows: Dict[str, QLabel] = {}
         
-        info_group.setLayout(info_layout)
+        info_group.setLayout(self._info_layout)
         layout.addWidget(info_group)
         
         # Project management buttons
         project_buttons_layout = QHBoxLayout()
         
         self.edit_project_button = QPushButton("Edit Project")
-        self.edit_project_button.clicked.connect(self.edit_project_requested.emit)
+        self.edit_project_button.clicked.connect(self.edit_project_requested)
         
         # LSL Management button (only for embedded webpage projects)
         import logging
@@ -788,7 +1057,7 @@ class ProjectDashboardWidget(QWidget):
         if self.project.project_type == ProjectType.EMBEDDED_WEBPAGE:
             logger.info("Creating LSL management button for embedded webpage project")
             self.lsl_management_button = QPushButton("Manage LSL Streams")
-            self.lsl_management_button.clicked.connect(self.lsl_management_requested.emit)
+            self.lsl_management_button.clicked.connect(self.lsl_management_requested)
             project_buttons_layout.addWidget(self.lsl_management_button)
         else:
             logger.info(f"Skipping LSL management button (project type {self.project.project_type} != EMBEDDED_WEBPAGE)")
@@ -810,19 +1079,19 @@ class ProjectDashboardWidget(QWidget):
         # Create large action buttons
         self.new_session_button = QPushButton("Start New Session")
         self.new_session_button.setMinimumHeight(80)
-        self.new_session_button.clicked.connect(self.new_session_requested.emit)
+        self.new_session_button.clicked.connect(self.new_session_requested)
         
         self.debug_session_button = QPushButton("Debug Session")
         self.debug_session_button.setMinimumHeight(80)
-        self.debug_session_button.clicked.connect(self.debug_session_requested.emit)
+        self.debug_session_button.clicked.connect(self.debug_session_requested)
         
         self.review_sessions_button = QPushButton("Review Sessions")
         self.review_sessions_button.setMinimumHeight(80)
-        self.review_sessions_button.clicked.connect(self.review_sessions_requested.emit)
+        self.review_sessions_button.clicked.connect(self.review_sessions_requested)
         
         self.export_button = QPushButton("Export Dataset")
         self.export_button.setMinimumHeight(80)
-        self.export_button.clicked.connect(self.export_data_requested.emit)
+        self.export_button.clicked.connect(self.export_data_requested)
         
         actions_layout.addWidget(self.new_session_button, 0, 0)
         actions_layout.addWidget(self.debug_session_button, 0, 1)
@@ -830,20 +1099,13 @@ class ProjectDashboardWidget(QWidget):
         actions_layout.addWidget(self.export_button, 1, 1)
         
         actions_group.setLayout(actions_layout)
+        # The Recent Sessions group, when shown, sits right after this one
+        self._actions_group_index = layout.count()
         layout.addWidget(actions_group)
         
         # Recent sessions
         if self.project.sessions:
-            sessions_group = QGroupBox("Recent Sessions")
-            sessions_layout = QVBoxLayout()
-            
-            # Create a custom widget for each session with delete button
-            for session_id in self.project.sessions[-5:]:  # Show last 5 sessions
-                session_widget = self._create_session_widget(session_id)
-                sessions_layout.addWidget(session_widget)
-            
-            sessions_group.setLayout(sessions_layout)
-            layout.addWidget(sessions_group)
+            layout.addWidget(self._new_sessions_group())
         
         layout.addStretch()
         self.setLayout(layout)
@@ -858,53 +1120,157 @@ class ProjectDashboardWidget(QWidget):
         self._refresh_project_info()
         self._refresh_sessions()
     
+    def showEvent(self, event):
+        """Build the project information rows the first time the dashboard is shown."""
+        super().showEvent(event)
+        if not self._info_rows:
+            self._populate_project_info(self._project_info_rows())
+    
+    def _project_info_rows(self) -> Dict[str, str]:
+        """Format the project information rows (label -> text) for the current project."""
+        rows = {
+            "Description:": self.project.description,
+            "Type:": _PROJECT_TYPE_DISPLAY[self.project.project_type],
+            "Created:": _format_datetime(self.project.created_date),
+            "Modified:": _format_datetime(self.project.modified_date),
+            "Sessions:": str(len(self.project.sessions)),
+            "Location:": str(self.project.project_path),
+        }
+        
+        # Add type-specific configuration info
+        if self.project.picture_slideshow_config:
+            config = self.project.picture_slideshow_config
+            rows["Slide Duration:"] = f"{config.slide_duration}s"
+            rows["Auto-play:"] = "Yes" if config.auto_play else "No"
+            rows["Manual Navigation:"] = "Yes" if config.manual_navigation else "No"
+        elif self.project.video_config:
+            config = self.project.video_config
+            if config.video_path:
+                rows["Video File:"] = config.video_path.name
+            rows["Auto-play:"] = "Yes" if config.auto_play else "No"
+            rows["Loop:"] = "Yes" if config.loop else "No"
+        elif self.project.screen_recording_config:
+            config = self.project.screen_recording_config
+            rows["Quality:"] = config.recording_quality.title()
+            rows["FPS:"] = str(config.fps)
+            rows["Mouse Tracking:"] = "Yes" if config.mouse_tracking else "No"
+        elif self.project.embedded_webpage_config:
+            config = self.project.embedded_webpage_config
+            if config.webpage_url:
+                rows["URL:"] = config.webpage_url
+            elif config.local_html_path:
+                rows["Local HTML:"] = config.local_html_path.name
+            rows["Marker API:"] = "Enabled" if config.enable_marker_api else "Disabled"
+        return rows
+    
+    def _populate_project_info(self, rows: Dict[str, str]):
+        """Create a label for each project information row."""
+        add_row = self._info_layout.addRow
+        for name, text in rows.items():
+            label = QLabel(text)
+            add_row(name, label)
+            self._info_rows[name] = label
+    
     def _refresh_project_info(self):
         """Refresh the project information display."""
-        # Update sessions count using stored reference
-        if hasattr(self, 'sessions_count_label'):
-            self.sessions_count_label.setText(str(len(self.project.sessions)))
+        if not self._info_rows:
+            # Not shown yet; the rows are built from the current project on first show
+            return
+        
+        rows = self._project_info_rows()
+        if rows.keys() == self._info_rows.keys():
+            # Same rows as before, only update their text
+            for name, text in rows.items():
+                self._info_rows[name].setText(text)
+        else:
+            # The project's configuration changed shape; rebuild the rows
+            while self._info_layout.rowCount():
+                self._info_layout.removeRow(0)
+            self._info_rows.clear()
+            self._populate_project_info(rows)
     
-    def _create_session_widget(self, session_id: str) -> QWidget:
-        """Create a widget for displaying a session with delete button.
+    def _new_sessions_group(self) -> QGroupBox:
+        """Create the Recent Sessions group, filled with the project's latest sessions."""
+        sessions_group = QGroupBox("Recent Sessions")
+        # Styles the labels and delete buttons of all rows; parsed once for the group
+        sessions_group.setStyleSheet(_SESSION_ROW_CSS)
+        sessions_layout = QVBoxLayout()
+        sessions_group.setLayout(sessions_layout)
+        
+        self._sessions_group = sessions_group
+        self._session_rows = []
+        self._show_recent_sessions(sessions_layout)
+        return sessions_group
+    
+    def _show_recent_sessions(self, sessions_layout: QVBoxLayout):
+        """Show the last _RECENT_SESSIONS_SHOWN sessions, reusing existing rows."""
+        sessions = self.project.sessions
+        # Index into the session list instead of slicing a copy of its tail
+        first = max(0, len(sessions) - _RECENT_SESSIONS_SHOWN)
+        shown = len(sessions) - first
+        rows = self._session_rows
+        while len(rows) < shown:
+            row = self._create_session_row()
+            sessions_layout.addWidget(row[0])
+            rows.append(row)
+        
+        for i, (session_widget, session_info, delete_button) in enumerate(rows):
+            if i < shown:
+                session_id = sessions[first + i]
+                session_info.setText(f"Session: {session_id}")
+                delete_button.setProperty("session_id", session_id)
+                session_widget.setVisible(True)
+            else:
+                session_widget.setVisible(False)
+    
+    def _create_session_row(self) -> Tuple[QWidget, QLabel, QPushButton]:
+        """Create a row for displaying a session with delete button.
+        
+        The session shown is set by _show_recent_sessions.
         
-        Args:
-            session_id: Session ID to display
-            
         Returns:
-            Widget containing session info and delete button
+            The row widget, its session label and its delete button
         """
         session_widget = QWidget()
         layout = QHBoxLayout()
         layout.setContentsMargins(5, 2, 5, 2)
         
         # Session info
-        session_info = QLabel(f"Session: {session_id}")
-        session_info.setStyleSheet("QLabel { padding: 5px; }")
+        session_info = QLabel()
+        session_info.setObjectName("sessionInfoLabel")
         
         # Delete button
         delete_button = QPushButton("🗑️")
+        delete_button.setObjectName("deleteSessionButton")
         delete_button.setToolTip("Delete this session")
         delete_button.setMaximumSize(30, 30)
-        delete_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ff4444;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #cc0000;
-            }
-        """)
-        delete_button.clicked.connect(lambda: self._delete_session(session_id))
+        delete_button.clicked.connect(self._on_delete_session_clicked)
         
         layout.addWidget(session_info)
         layout.addStretch()
         layout.addWidget(delete_button)
         
         session_widget.setLayout(layout)
-        return session_widget
+        return session_widget, session_info, delete_button
+    
+    def _on_delete_session_clicked(self):
+        """Delete the session of the row whose delete button was clicked."""
+        self._delete_session(self.sender().property("session_id"))
+    
+    def _project_manager_window(self) -> Optional[QWidget]:
+        """Find the ancestor window that owns the project manager (cached until reparented)."""
+        if self._project_manager_owner is None:
+            parent_window = self.parent()
+            while parent_window and not hasattr(parent_window, 'project_manager'):
+                parent_window = parent_window.parent()
+            self._project_manager_owner = parent_window
+        return self._project_manager_owner
+    
+    def changeEvent(self, event):
+        """Forget the cached project manager owner when the widget is reparented."""
+        if event.type() == QEvent.Type.ParentChange:
+            self._project_manager_owner = None
+        super().changeEvent(event)
     
     def _delete_session(self, session_id: str):
         """Handle session deletion with confirmation dialog.
@@ -930,11 +1296,9 @@ class ProjectDashboardWidget(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 # Get the project manager from the parent window
-                parent_window = self.parent()
-                while parent_window and not hasattr(parent_window, 'project_manager'):
-                    parent_window = parent_window.parent()
+                parent_window = self._project_manager_window()
                 
-                if parent_window and hasattr(parent_window, 'project_manager'):
+                if parent_window:
                     project_manager = parent_window.project_manager
                     
                     # Delete the session
@@ -969,74 +1333,33 @@ class ProjectDashboardWidget(QWidget):
     
     def _refresh_sessions(self):
         """Refresh the sessions display."""
-        # Find the sessions group
-        sessions_group = None
-        for i in range(self.layout().count()):
-            child = self.layout().itemAt(i).widget()
-            if isinstance(child, QGroupBox) and child.title() == "Recent Sessions":
-                sessions_group = child
-                break
-        
+        sessions_group = self._sessions_group
         if sessions_group:
             if self.project.sessions:
-                # Sessions group exists and there are sessions, update its content
-                sessions_layout = sessions_group.layout()
-                
-                # Clear existing session widgets
-                for i in reversed(range(sessions_layout.count())):
-                    child = sessions_layout.itemAt(i).widget()
-                    if child:
-                        child.deleteLater()
-                
-                # Add new session widgets
-                for session_id in self.project.sessions[-5:]:  # Show last 5 sessions
-                    session_widget = self._create_session_widget(session_id)
-                    sessions_layout.addWidget(session_widget)
+                # Sessions group exists and there are sessions, update its rows in place
+                self._show_recent_sessions(sessions_group.layout())
             else:
                 # Sessions group exists but no sessions, remove it
+                self.layout().removeWidget(sessions_group)
                 sessions_group.deleteLater()
+                self._sessions_group = None
+                self._session_rows = []
         else:
             # Sessions group doesn't exist, create it if there are sessions
             if self.project.sessions:
                 self._create_sessions_group()
     
     def _create_sessions_group(self):
-        """Create the sessions group and add it to the layout."""
-        # Find the position to insert the sessions group (after actions group, before stretch)
-        insert_position = -1  # Default to end, before stretch
-        for i in range(self.layout().count()):
-            child = self.layout().itemAt(i).widget()
-            if isinstance(child, QGroupBox) and child.title() == "Project Actions":
-                insert_position = i + 1
-                break
-        
-        # Create sessions group
-        sessions_group = QGroupBox("Recent Sessions")
-        sessions_layout = QVBoxLayout()
-        
-        # Create session widgets
-        for session_id in self.project.sessions[-5:]:  # Show last 5 sessions
-            session_widget = self._create_session_widget(session_id)
-            sessions_layout.addWidget(session_widget)
-        
-        sessions_group.setLayout(sessions_layout)
-        
-        # Insert at the correct position
-        if insert_position >= 0:
-            self.layout().insertWidget(insert_position, sessions_group)
-        else:
-            # Fallback: add before stretch
-            self.layout().insertWidget(self.layout().count() - 1, sessions_group)
+        """Create the sessions group and add it to the layout, right after the actions group."""
+        self.layout().insertWidget(self._actions_group_index + 1, self._new_sessions_group())
     
     def _manual_refresh(self):
         """Manually refresh the project dashboard."""
         try:
             # Get the project manager from the parent window to reload project data
-            parent_window = self.parent()
-            while parent_window and not hasattr(parent_window, 'project_manager'):
-                parent_window = parent_window.parent()
+            parent_window = self._project_manager_window()
             
-            if parent_window and hasattr(parent_window, 'project_manager'):
+            if parent_window:
                 project_manager = parent_window.project_manager
                 
                 # Reload the project data
@@ -1081,14 +1404,50 @@ class DebugSessionWindow(QWidget):
         self.tracking_timer = QTimer()
         self.tracking_timer.timeout.connect(self._update_tracking_data)
         
-        # Tracking data storage
-        self.mouse_positions = []
-        self.mouse_clicks = []
+        # Tracking data storage; mouse positions are kept in a preallocated
+        # (capacity, 2) int32 array that doubles when full
+        self._mouse_xy = np.empty((1024, 2), dtype=np.int32)
+        self._mouse_n = 0
+        # Clicks as (x, y, Qt button value) rows, stored the same way
+        self._click_rows = np.empty((64, 3), dtype=np.int32)
+        self._click_n = 0
         self.session_start_time = None
         
+        # Paint caches: the grid, trail and clicks are kept in an image that is
+        # rendered in full once per canvas size and then only gets what was
+        # added since the last paint drawn into it. The trail and click paths
+        # are extended point by point for those full renders
+        self._back_image: Optional[QImage] = None
+        self._back_trail_drawn = 0
+        self._back_clicks_drawn = 0
+        self._trail_path = QPainterPath()
+        self._trail_end: Optional[Tuple[int, int]] = None
+        self._clicks_path = QPainterPath()
+        self._grid_pen = QPen(QColor(200, 200, 200), 1)
+        self._trail_pen = QPen(QColor(0, 150, 255), 2)
+        self._click_pen = QPen(QColor(255, 0, 0), 4)
+        self._cursor_pen = QPen(QColor(0, 255, 0), 6)
+        
+        # Mouse moves are painted at most once per frame (see _on_mouse_move)
+        self._canvas_dirty = QRect()
+        self._canvas_repaint_timer = QTimer(self)
+        self._canvas_repaint_timer.setSingleShot(True)
+        self._canvas_repaint_timer.setInterval(_CANVAS_REPAINT_INTERVAL_MS)
+        self._canvas_repaint_timer.timeout.connect(self._flush_canvas_update)
+        
         self._setup_ui()
         self._setup_tracking()
     
+    @property
+    def mouse_positions(self) -> np.ndarray:
+        """Recorded mouse positions as an (n, 2) array view."""
+        return self._mouse_xy[:self._mouse_n]
+    
+    @property
+    def mouse_clicks(self) -> np.ndarray:
+        """Recorded click positions as an (n, 2) array view."""
+        return self._click_rows[:self._click_n, :2]
+    
     def _setup_ui(self):
         """Set up the debug session UI."""
         self.setWindowTitle(f"Debug Session - {self.project.name}")
@@ -1100,11 +1459,11 @@ class DebugSessionWindow(QWidget):
         header_layout = QHBoxLayout()
         
         self.back_button = QPushButton("← Back to Project")
-        self.back_button.clicked.connect(self.session_ended.emit)
+        self.back_button.clicked.connect(self.session_ended)
         
         self.record_button = QPushButton("Start Recording")
         self.record_button.clicked.connect(self._toggle_recording)
-        self.record_button.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
+        self.record_button.setStyleSheet(_RECORD_START_CSS)
         
         self.clear_button = QPushButton("Clear Data")
         self.clear_button.clicked.connect(self._clear_tracking_data)
@@ -1125,7 +1484,7 @@ class DebugSessionWindow(QWidget):
         
         # Mouse position display
         self.mouse_pos_label = QLabel("Mouse: (0, 0)")
-        self.mouse_pos_label.setFont(QFont("Arial", 12))
+        self.mouse_pos_label.setFont(_font("Arial", 12))
         tracking_layout.addWidget(self.mouse_pos_label)
         
         # Mouse movement visualization
@@ -1134,6 +1493,7 @@ class DebugSessionWindow(QWidget):
         self.mouse_canvas.setStyleSheet("QWidget { background-color: #f0f0f0; border: 1px solid #ccc; }")
         self.mouse_canvas.mouseMoveEvent = self._on_mouse_move
         self.mouse_canvas.paintEvent = self._on_paint
+        self.mouse_canvas.resizeEvent = self._on_canvas_resize
         tracking_layout.addWidget(self.mouse_canvas)
         
         # Tracking statistics
@@ -1157,7 +1517,7 @@ class DebugSessionWindow(QWidget):
         info_group = QGroupBox("Project Information")
         info_layout = QFormLayout()
         
-        info_layout.addRow("Type:", QLabel(self.project.project_type.value.replace('_', ' ').title()))
+        info_layout.addRow("Type:", QLabel(_PROJECT_TYPE_DISPLAY[self.project.project_type]))
         info_layout.addRow("Description:", QLabel(self.project.description))
         
         # Add type-specific info
@@ -1207,10 +1567,12 @@ class DebugSessionWindow(QWidget):
         data_group = QGroupBox("Live Data Feed")
         data_layout = QVBoxLayout()
         
-        self.data_text = QTextEdit()
+        # Plain text with a line cap, so the feed stays cheap however long the session runs
+        self.data_text = QPlainTextEdit()
         self.data_text.setMaximumHeight(150)
         self.data_text.setReadOnly(True)
-        self.data_text.setFont(QFont("Consolas", 9))
+        self.data_text.setMaximumBlockCount(_LIVE_FEED_MAX_LINES)
+        self.data_text.setFont(_font("Consolas", 9))
         data_layout.addWidget(self.data_text)
         
         data_group.setLayout(data_layout)
@@ -1227,8 +1589,8 @@ class DebugSessionWindow(QWidget):
         self.tracking_timer.start(50)  # 20 FPS updates
         
         # Set up session start time
-        from datetime import datetime
         self.session_start_time = datetime.now()
+        self._shown_elapsed_s = -1  # Session time currently on the label, in whole seconds
     
     def _toggle_recording(self):
         """Toggle recording state."""
@@ -1241,7 +1603,7 @@ class DebugSessionWindow(QWidget):
         """Start recording tracking data."""
         self.is_recording = True
         self.record_button.setText("Stop Recording")
-        self.record_button.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-weight: bold; }")
+        self.record_button.setStyleSheet(_RECORD_STOP_CSS)
         
         # Add start marker
         self._add_data_entry("Recording started")
@@ -1250,16 +1612,21 @@ class DebugSessionWindow(QWidget):
         """Stop recording tracking data."""
         self.is_recording = False
         self.record_button.setText("Start Recording")
-        self.record_button.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
+        self.record_button.setStyleSheet(_RECORD_START_CSS)
         
         # Add stop marker
         self._add_data_entry("Recording stopped")
     
     def _clear_tracking_data(self):
         """Clear all tracking data."""
-        self.mouse_positions.clear()
-        self.mouse_clicks.clear()
+        self._mouse_n = 0
+        self._click_n = 0
+        self._trail_path = QPainterPath()
+        self._trail_end = None
+        self._clicks_path = QPainterPath()
+        self._back_image = None
         self.session_start_time = datetime.now()
+        self._shown_elapsed_s = -1
         self.total_moves_label.setText("0")
         self.total_clicks_label.setText("0")
         self.data_text.clear()
@@ -1270,71 +1637,141 @@ class DebugSessionWindow(QWidget):
     def _on_mouse_move(self, event):
         """Handle mouse movement on the canvas."""
         if self.is_recording:
-            pos = (event.pos().x(), event.pos().y())
-            self.mouse_positions.append(pos)
-            self.mouse_pos_label.setText(f"Mouse: ({pos[0]}, {pos[1]})")
-            self.total_moves_label.setText(str(len(self.mouse_positions)))
+            event_pos = event.pos()
+            pos = (event_pos.x(), event_pos.y())
+            n = self._mouse_n
+            prev_pos = self._mouse_xy[n - 1].tolist() if n else pos
+            
+            # The trail only gets a new vertex once the pointer has moved a
+            # visible distance; the full-resolution data stays in _mouse_xy
+            trail_end = self._trail_end
+            if trail_end is None:
+                self._trail_path.moveTo(pos[0], pos[1])
+                self._trail_end = pos
+            elif max(abs(pos[0] - trail_end[0]), abs(pos[1] - trail_end[1])) >= _TRAIL_MIN_STEP_PX:
+                self._trail_path.lineTo(pos[0], pos[1])
+                self._trail_end = pos
+            
+            self._mouse_xy = _store_row(self._mouse_xy, n, pos)
+            self._mouse_n = n + 1
+            
+            # Repaint only the new segment, with room for the position marker.
+            # Moves arrive faster than the screen refreshes, so the dirty area
+            # is collected and flushed at most once per frame
+            dirty = QRect(QPoint(*prev_pos), QPoint(*pos)).normalized()
+            self._canvas_dirty = self._canvas_dirty.united(dirty.adjusted(-8, -8, 8, 8))
+            if not self._canvas_repaint_timer.isActive():
+                self._canvas_repaint_timer.start()
+    
+    def _flush_canvas_update(self):
+        """Repaint the area touched since the last frame and refresh the move labels."""
+        if self._mouse_n:
+            x, y = self._mouse_xy[self._mouse_n - 1].tolist()
+            self.mouse_pos_label.setText(f"Mouse: ({x}, {y})")
+        self.total_moves_label.setText(str(self._mouse_n))
+        self.mouse_canvas.update(self._canvas_dirty)
+        self._canvas_dirty = QRect()
+    
+    def _on_canvas_resize(self, event):
+        """Drop the canvas image so it is rebuilt at the new canvas size."""
+        self._back_image = None
+        QWidget.resizeEvent(self.mouse_canvas, event)
+    
+    def _build_back_image(self) -> QImage:
+        """Render the grid and everything recorded so far into a new canvas image."""
+        width, height = self.mouse_canvas.width(), self.mouse_canvas.height()
+        ratio = self.mouse_canvas.devicePixelRatioF()
+        image = QImage(round(width * ratio), round(height * ratio),
+                       QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(image)
+        # The axis-aligned grid is drawn without antialiasing; only the
+        # curves drawn on top of it need it
+        painter.setPen(self._grid_pen)
+        painter.drawLines([QLineF(x, 0, x, height) for x in range(0, width, 50)] +
+                          [QLineF(0, y, width, y) for y in range(0, height, 50)])
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._trail_pen)
+        painter.drawPath(self._trail_path)
+        painter.setPen(self._click_pen)
+        painter.drawPath(self._clicks_path)
+        painter.end()
+        
+        self._back_trail_drawn = self._trail_path.elementCount()
+        self._back_clicks_drawn = self._click_n
+        return image
+    
+    def _draw_new_marks(self):
+        """Draw the trail segments and clicks added since the last paint into the canvas image."""
+        trail_count = self._trail_path.elementCount()
+        if trail_count == self._back_trail_drawn and self._click_n == self._back_clicks_drawn:
+            return
+        
+        painter = QPainter(self._back_image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if trail_count > self._back_trail_drawn:
+            # The trail is a single moveTo followed by lineTo elements
+            path = self._trail_path
+            points = [path.elementAt(i) for i in range(max(self._back_trail_drawn - 1, 0), trail_count)]
+            painter.setPen(self._trail_pen)
+            painter.drawLines([QLineF(a.x, a.y, b.x, b.y) for a, b in zip(points, points[1:])])
+            self._back_trail_drawn = trail_count
+        if self._click_n > self._back_clicks_drawn:
+            painter.setPen(self._click_pen)
+            for x, y in self._click_rows[self._back_clicks_drawn:self._click_n, :2].tolist():
+                painter.drawEllipse(x - 3, y - 3, 6, 6)
+            self._back_clicks_drawn = self._click_n
+        painter.end()
     
     def _on_paint(self, event):
         """Paint the mouse tracking visualization."""
-        from PySide6.QtGui import QPainter, QPen, QColor
+        if self._back_image is None:
+            self._back_image = self._build_back_image()
+        else:
+            self._draw_new_marks()
         
         painter = QPainter(self.mouse_canvas)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Draw background grid
-        painter.setPen(QPen(QColor(200, 200, 200), 1))
-        for x in range(0, self.mouse_canvas.width(), 50):
-            painter.drawLine(x, 0, x, self.mouse_canvas.height())
-        for y in range(0, self.mouse_canvas.height(), 50):
-            painter.drawLine(0, y, self.mouse_canvas.width(), y)
-        
-        # Draw mouse movement trail
-        if len(self.mouse_positions) > 1:
-            painter.setPen(QPen(QColor(0, 150, 255), 2))
-            for i in range(1, len(self.mouse_positions)):
-                prev_pos = self.mouse_positions[i-1]
-                curr_pos = self.mouse_positions[i]
-                painter.drawLine(prev_pos[0], prev_pos[1], curr_pos[0], curr_pos[1])
-        
-        # Draw mouse clicks
-        painter.setPen(QPen(QColor(255, 0, 0), 4))
-        for click_pos in self.mouse_clicks:
-            painter.drawEllipse(click_pos[0] - 3, click_pos[1] - 3, 6, 6)
+        # Grid, trail and clicks
+        painter.drawImage(0, 0, self._back_image)
         
         # Draw current mouse position
-        if self.mouse_positions:
-            current_pos = self.mouse_positions[-1]
-            painter.setPen(QPen(QColor(0, 255, 0), 6))
+        if self._mouse_n:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            current_pos = self._mouse_xy[self._mouse_n - 1].tolist()
+            painter.setPen(self._cursor_pen)
             painter.drawEllipse(current_pos[0] - 4, current_pos[1] - 4, 8, 8)
     
     def _update_tracking_data(self):
         """Update tracking data display."""
         if self.session_start_time:
-            elapsed = datetime.now() - self.session_start_time
-            minutes = int(elapsed.total_seconds() // 60)
-            seconds = int(elapsed.total_seconds() % 60)
-            self.session_time_label.setText(f"{minutes:02d}:{seconds:02d}")
+            elapsed_s = int((datetime.now() - self.session_start_time).total_seconds())
+            # The label shows whole seconds; skip the other ticks of each second
+            if elapsed_s == self._shown_elapsed_s:
+                return
+            self._shown_elapsed_s = elapsed_s
+            self.session_time_label.setText(f"{elapsed_s // 60:02d}:{elapsed_s % 60:02d}")
     
     def _add_data_entry(self, message: str):
         """Add a data entry to the live feed."""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        self.data_text.append(f"[{timestamp}] {message}")
-        
-        # Auto-scroll to bottom
-        scrollbar = self.data_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        now = datetime.now()
+        # Scrolls to the new line when the view is already at the bottom
+        self.data_text.appendPlainText(f"[{now:%H:%M:%S}.{now.microsecond // 1000:03d}] {message}")
     
     def mousePressEvent(self, event):
         """Handle mouse clicks globally."""
         if self.is_recording:
-            pos = (event.pos().x(), event.pos().y())
-            self.mouse_clicks.append(pos)
-            self.total_clicks_label.setText(str(len(self.mouse_clicks)))
+            event_pos = event.pos()
+            x, y = event_pos.x(), event_pos.y()
+            button = event.button()
+            self._click_rows = _store_row(self._click_rows, self._click_n, (x, y, button.value))
+            self._click_n += 1
+            self._clicks_path.addEllipse(x - 3, y - 3, 6, 6)
+            self.total_clicks_label.setText(str(self._click_n))
             
-            button = "Left" if event.button() == Qt.MouseButton.LeftButton else "Right" if event.button() == Qt.MouseButton.RightButton else "Middle"
-            self._add_data_entry(f"Mouse {button} click at ({pos[0]}, {pos[1]})")
+            self._add_data_entry(f"Mouse {_MOUSE_BUTTON_NAMES.get(button, 'Middle')} click at ({x}, {y})")
     
     def closeEvent(self, event):
         """Handle window close event."""
@@ -1356,11 +1793,10 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
         
         # LSL integration components
         self.bridge: Optional[Bridge] = None
-        self.channel: Optional[QWebChannel] = None
+        self.channel = None  # QWebChannel, created in _setup_bridge
         self.lsl_streamer: Optional[LSLBridgeStreamer] = None
         self.lsl_mouse_streamer: Optional[LSLMouseTrackingStreamer] = None
         self.lsl_recorder: Optional[LSLRecorder] = None
-        self.lsl_timer: Optional[QTimer] = None
         
         # Screen recording component
         self.screen_recorder: Optional[ScreenRecorder] = None
@@ -1374,8 +1810,16 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
         # Store window size configuration for coordinate normalization
         config = self.project.embedded_webpage_config
         self.target_window_size = config.window_size if config else None
+        self._applied_window_size: Optional[Tuple[int, int]] = None  # Set by _apply_window_config
         self.enforce_fullscreen = config.enforce_fullscreen if config else False
         self.normalize_mouse_coordinates = config.normalize_mouse_coordinates if config else True
+        self.poll_cursor_when_idle = config.poll_cursor_when_idle if config else False
+        self._last_mouse_event_time = 0.0  # time.monotonic() of the last tracked mouse event
+        # Mouse moves closer together than this are passed on to the page but not recorded
+        self._mouse_move_min_interval = (config.mouse_move_min_interval_ms if config else 8.0) / 1000.0
+        self._last_mouse_move_time = 0.0
+        # 1 / reference width and height, set by _update_normalization_scale
+        self._inv_ref_w = self._inv_ref_h = 0.0
         
         # Ensure window appears in taskbar and is visible
         # Set window flags before showing
@@ -1419,7 +1863,7 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
         
         # Session info
         info_label = QLabel(f"Session: {self.session.name}")
-        info_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        info_label.setFont(_font("Arial", 12, QFont.Weight.Bold))
         header_layout.addWidget(info_label)
         
         header_layout.addStretch()
@@ -1434,10 +1878,12 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
         layout.addLayout(header_layout)
         
         # Webpage display area
+        from PySide6.QtWebEngineWidgets import QWebEngineView
+        from PySide6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile
         self.web_view = QWebEngineView()
         
         # Set custom page that forwards console messages to Python
-        self.web_view.setPage(ConsoleLoggingWebPage(self.web_view))
+        self.web_view.setPage(_console_logging_web_page_class()(self.web_view))
         
         layout.addWidget(self.web_view)
         
@@ -1489,19 +1935,11 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             # Enable persistent cookies and cache for better media loading
             profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
             profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.AllowPersistentCookies)
+            # Bound the cache so it does not keep growing across sessions
+            profile.setHttpCacheMaximumSize(_WEB_HTTP_CACHE_MAX_BYTES)
         except Exception as e:
             print(f"Warning: Could not configure web profile for media: {e}")
         
-        # Also try setting via page profile (alternative method)
-        try:
-            profile = self.web_view.page().profile()
-            # Some Qt versions require setting this on the profile
-            if hasattr(profile, 'setHttpUserAgent'):
-                # This ensures the page is properly configured
-                pass
-        except Exception:
-            pass
-        
         # Status bar
         status_msg = "Session started - tracking active"
         if LSL_AVAILABLE:
@@ -1521,8 +1959,12 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             self.showFullScreen()
             print(f"[SessionWindow] Enforced fullscreen mode")
         elif config.window_size:
+            if self._applied_window_size == tuple(config.window_size):
+                # Already at this size and centered
+                return
             # Set fixed window size
             width, height = config.window_size
+            self._applied_window_size = (width, height)
             self.setFixedSize(width, height)
             # Center window on screen
             screen = self.screen().availableGeometry()
@@ -1535,6 +1977,24 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             self.setMinimumSize(1200, 800)
             print(f"[SessionWindow] Using default window size (resizable)")
     
+    def _update_normalization_scale(self):
+        """Cache the reciprocal of the reference size used to normalize mouse coordinates.
+        
+        The reference is target_window_size if set, otherwise the web view's
+        current size (kept up to date by eventFilter).
+        """
+        if self.target_window_size:
+            ref_width, ref_height = self.target_window_size
+        else:
+            ref_width, ref_height = self.web_view.width(), self.web_view.height()
+        
+        if ref_width > 0 and ref_height > 0:
+            self._inv_ref_w = 1.0 / ref_width
+            self._inv_ref_h = 1.0 / ref_height
+        else:
+            # Invalid size; _normalize_mouse_coordinates falls back to absolute coordinates
+            self._inv_ref_w = self._inv_ref_h = 0.0
+    
     def _normalize_mouse_coordinates(self, x: float, y: float) -> tuple:
         """Normalize mouse coordinates relative to window size.
         
@@ -1550,28 +2010,16 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
         if not self.normalize_mouse_coordinates:
             return (float(x), float(y))
         
-        # Determine reference size for normalization
-        if self.target_window_size:
-            # Use configured window size
-            ref_width, ref_height = self.target_window_size
-        else:
-            # Use current window size as fallback
-            geometry = self.web_view.geometry()
-            ref_width = float(geometry.width())
-            ref_height = float(geometry.height())
-        
-        # Normalize to 0-1 range
-        if ref_width > 0 and ref_height > 0:
-            norm_x = float(x) / ref_width
-            norm_y = float(y) / ref_height
-            # Clamp to 0-1 range (in case coordinates are slightly outside bounds)
-            norm_x = max(0.0, min(1.0, norm_x))
-            norm_y = max(0.0, min(1.0, norm_y))
-            return (norm_x, norm_y)
-        else:
+        if not self._inv_ref_w:
             # Fallback: return absolute coordinates if size is invalid
-            print(f"[MouseTracking] Warning: Invalid window size for normalization ({ref_width}x{ref_height}), using absolute coordinates")
+            print("[MouseTracking] Warning: Invalid window size for normalization, using absolute coordinates")
             return (float(x), float(y))
+        
+        # Normalize to 0-1 range, clamped in case coordinates are slightly outside bounds
+        norm_x = x * self._inv_ref_w
+        norm_y = y * self._inv_ref_h
+        return (0.0 if norm_x < 0.0 else 1.0 if norm_x > 1.0 else norm_x,
+                0.0 if norm_y < 0.0 else 1.0 if norm_y > 1.0 else norm_y)
     
     def _load_webpage(self):
         """Load the webpage based on project configuration."""
@@ -1588,15 +2036,7 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             self.statusBar().showMessage(f"Loading local webpage: {config.local_html_path}")
         else:
             # Show error page
-            error_html = """
-            <html>
-            <body style="font-family: Arial, sans-serif; text-align: center; padding: 50px;">
-                <h2>No Webpage Configured</h2>
-                <p>Please configure a webpage URL or local HTML file in the project settings.</p>
-            </body>
-            </html>
-            """
-            self.web_view.setHtml(error_html)
+            self.web_view.setHtml(_NO_WEBPAGE_HTML)
             self.statusBar().showMessage("No webpage configured")
     
     def _setup_bridge(self):
@@ -1606,14 +2046,18 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             self.bridge = Bridge()
             
             # Create QWebChannel and register bridge
+            from PySide6.QtWebChannel import QWebChannel
             self.channel = QWebChannel()
             self.channel.registerObject("bridge", self.bridge)
             
             # Set channel on web view
             self.web_view.page().setWebChannel(self.channel)
             
-            # Connect bridge event signal to LSL streaming
-            self.bridge.event_received.connect(self._handle_bridge_event)
+            # Connect bridge event signal to LSL streaming. The bridge emits on the GUI
+            # thread, so the handler is called inline rather than through the event queue
+            self.bridge.event_received.connect(self._handle_bridge_event,
+                                               Qt.ConnectionType.DirectConnection)
+            self.bridge.session_end_received.connect(self._handle_bridge_session_end)
             
             # Set up LSL streaming and recording
             if LSL_AVAILABLE:
@@ -1650,7 +2094,12 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
                     filters = None
                     if lsl_config and getattr(lsl_config, 'additional_stream_filters', None):
                         filters = lsl_config.additional_stream_filters
-                    self.lsl_recorder.start_recording(wait_time=2.0, stream_name_filters=filters)
+                    # Samples are spooled to disk as they arrive so memory use stays flat over
+                    # long sessions; _save_session_data turns the spool into the final recording
+                    spool_path = (self.project.project_path / "sessions" / self.session.session_id /
+                                  f"lsl_recording_{self.session.session_id}.jsonl")
+                    self.lsl_recorder.start_recording(wait_time=2.0, stream_name_filters=filters,
+                                                      spool_path=str(spool_path))
                     
                     # Push session_start event to LSL
                     session_start_event = {
@@ -1664,10 +2113,9 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
                     if self.lsl_streamer:
                         self.lsl_streamer.push_event(session_start_event)
                     
-                    # Start LSL recording timer (50 Hz = every 20ms to avoid overload)
-                    self.lsl_timer = QTimer()
-                    self.lsl_timer.timeout.connect(self._safe_record_lsl_sample)
-                    self.lsl_timer.start(20)  # 20ms = 50 Hz
+                    # Pull samples on the recorder's own thread (every 20ms = 50 Hz) so
+                    # recording never blocks the GUI thread; stop_recording() ends it
+                    self.lsl_recorder.start_polling(interval=0.02)
                     
                     self.statusBar().showMessage("Bridge and LSL initialized successfully")
                 except Exception as e:
@@ -1680,15 +2128,6 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             print(f"Error setting up bridge: {e}")
             self.statusBar().showMessage(f"Bridge setup error: {e}")
     
-    def _safe_record_lsl_sample(self):
-        """Safely record LSL sample with error handling."""
-        try:
-            if self.lsl_recorder and self.lsl_recorder.is_recording:
-                self.lsl_recorder.record_sample()
-        except Exception as e:
-            # Don't print errors for every failed sample - just log occasionally
-            pass
-    
     def _handle_bridge_event(self, event_data: Dict[str, Any]):
         """Handle events received from the HTML bridge.
         
@@ -1699,12 +2138,8 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             event_type = event_data.get('type', 'unknown')
             event_data_dict = event_data.get('data', {})
             
-            # Check for session end event
+            # Session end is handled by _handle_bridge_session_end and not streamed
             if event_type == 'session_end':
-                # Automatically end the session
-                self.statusBar().showMessage("Session ending...", 2000)
-                # Use QTimer to end session in next event loop iteration
-                QTimer.singleShot(500, self._end_session)
                 return
             
             # Stream to LSL (all events go through LSL, no separate tracking_data)
@@ -1717,18 +2152,52 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
         except Exception as e:
             print(f"Error handling bridge event: {e}")
     
+    def _handle_bridge_session_end(self, event_data: Dict[str, Any]):
+        """Automatically end the session when the page sends a session_end event."""
+        self.statusBar().showMessage("Session ending...", 2000)
+        # Use QTimer to end session in next event loop iteration
+        QTimer.singleShot(500, self._end_session)
+    
     def _setup_tracking(self):
         """Set up tracking data collection."""
-        # Start tracking timer (every 100ms = 10 FPS)
-        self.tracking_timer = QTimer()
-        self.tracking_timer.timeout.connect(self._collect_tracking_data)
-        self.tracking_timer.start(100)
-        
-        # Track mouse events
-        self.web_view.mousePressEvent = self._on_mouse_press
-        self.web_view.mouseReleaseEvent = self._on_mouse_release
-        self.web_view.mouseMoveEvent = self._on_mouse_move
-        self.web_view.wheelEvent = self._on_wheel_event
+        # Mouse events are tracked by the handlers below. The cursor is only
+        # polled (every 100ms = 10 FPS) when configured, as an idle heartbeat
+        if self.poll_cursor_when_idle:
+            self.tracking_timer = QTimer()
+            self.tracking_timer.timeout.connect(self._collect_tracking_data)
+            self.tracking_timer.start(100)
+        
+        # Mouse samples are queued by the handlers below and pushed to LSL
+        # together every _MOUSE_FLUSH_INTERVAL_MS
+        self._mouse_flush_timer = QTimer(self)
+        self._mouse_flush_timer.timeout.connect(self._flush_mouse_events)
+        self._mouse_flush_timer.start(_MOUSE_FLUSH_INTERVAL_MS)
+        
+        # Normalization follows the web view size unless a window size is configured
+        self._update_normalization_scale()
+        
+        # Track mouse events and resizes through eventFilter. The page itself is
+        # drawn by a child widget of the view that receives the mouse events, so
+        # the filter is installed on the view's child widgets as well
+        self.web_view.installEventFilter(self)
+        for child in self.web_view.findChildren(QWidget):
+            child.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        """Track mouse events of the web view without consuming them."""
+        event_type = event.type()
+        if event_type in _TRACKED_MOUSE_EVENTS:
+            # Once the page's render widget exists it reports the mouse events;
+            # skip the copies that propagate from it to the view
+            if obj is not self.web_view or self.web_view.focusProxy() is None:
+                getattr(self, _TRACKED_MOUSE_EVENTS[event_type])(event)
+        elif obj is self.web_view:
+            if event_type == QEvent.Type.Resize:
+                if not self.target_window_size:
+                    self._update_normalization_scale()
+            elif event_type == QEvent.Type.ChildAdded and event.child().isWidgetType():
+                event.child().installEventFilter(self)
+        return False
     
     def _setup_screen_recording(self):
         """Set up screen recording."""
@@ -1779,138 +2248,55 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             print(f"Warning: Could not start screen recording: {e}")
             self.statusBar().showMessage(f"Screen recording unavailable: {e}", 2000)
     
-    def _collect_tracking_data(self):
-        """Collect current tracking data."""
-        cursor_pos = self.web_view.mapFromGlobal(self.web_view.cursor().pos())
-        abs_x, abs_y = cursor_pos.x(), cursor_pos.y()
-        
-        # Normalize coordinates if configured
-        norm_x, norm_y = self._normalize_mouse_coordinates(abs_x, abs_y)
-        
-        tracking_point = {
-            'timestamp': datetime.now().isoformat(),
-            'mouse_position': (norm_x, norm_y),  # Store normalized coordinates
-            'absolute_position': (abs_x, abs_y),  # Also store absolute for reference
-            'session_id': self.session.session_id
-        }
-        
-        # Stream to LSL (all data goes through LSL, no separate tracking_data)
+    def _flush_mouse_events(self):
+        """Push the mouse samples queued since the last flush to LSL."""
         if self.lsl_mouse_streamer:
-            self.lsl_mouse_streamer.push_tracking_data(tracking_point)
+            self.lsl_mouse_streamer.flush()
     
-    def _on_mouse_press(self, event):
-        """Handle mouse press events."""
-        cursor_pos = self.web_view.mapFromGlobal(event.globalPos())
-        abs_x, abs_y = cursor_pos.x(), cursor_pos.y()
-        
-        # Normalize coordinates if configured
-        norm_x, norm_y = self._normalize_mouse_coordinates(abs_x, abs_y)
-        
-        tracking_point = {
-            'timestamp': datetime.now().isoformat(),
-            'mouse_position': (norm_x, norm_y),  # Store normalized coordinates
-            'absolute_position': (abs_x, abs_y),  # Also store absolute for reference
-            'event_type': 'mouse_press',
-            'button': event.button(),
-            'session_id': self.session.session_id
-        }
+    def _queue_mouse_sample(self, global_pos, event_type: str = ''):
+        """Queue the mouse position (in global coordinates) for LSL.
         
-        # Stream to LSL (all data goes through LSL, no separate tracking_data)
+        Args:
+            global_pos: Mouse position in global screen coordinates
+            event_type: Mouse event name ('mouse_press', 'mouse_move', ...), or '' for a position sample
+        """
+        # All data goes through LSL, no separate tracking_data
         if self.lsl_mouse_streamer:
-            self.lsl_mouse_streamer.push_tracking_data(tracking_point)
+            cursor_pos = self.web_view.mapFromGlobal(global_pos)
+            # Normalize coordinates if configured
+            norm_x, norm_y = self._normalize_mouse_coordinates(cursor_pos.x(), cursor_pos.y())
+            self.lsl_mouse_streamer.queue_position(norm_x, norm_y, event_type)
+    
+    def _collect_tracking_data(self):
+        """Collect current tracking data while the mouse is idle."""
+        if time.monotonic() - self._last_mouse_event_time < _CURSOR_IDLE_S:
+            # The mouse handlers are already reporting the position
+            return
         
-        # Call parent's mouse press event
-        super(QWebEngineView, self.web_view).mousePressEvent(event)
+        self._queue_mouse_sample(self.web_view.cursor().pos())
+    
+    def _on_mouse_press(self, event):
+        """Handle mouse press events."""
+        self._last_mouse_event_time = time.monotonic()
+        self._queue_mouse_sample(event.globalPos(), 'mouse_press')
     
     def _on_mouse_release(self, event):
         """Handle mouse release events."""
-        cursor_pos = self.web_view.mapFromGlobal(event.globalPos())
-        abs_x, abs_y = cursor_pos.x(), cursor_pos.y()
-        
-        # Normalize coordinates if configured
-        norm_x, norm_y = self._normalize_mouse_coordinates(abs_x, abs_y)
-        
-        tracking_point = {
-            'timestamp': datetime.now().isoformat(),
-            'mouse_position': (norm_x, norm_y),  # Store normalized coordinates
-            'absolute_position': (abs_x, abs_y),  # Also store absolute for reference
-            'event_type': 'mouse_release',
-            'button': event.button(),
-            'session_id': self.session.session_id
-        }
-        
-        # Stream to LSL (all data goes through LSL, no separate tracking_data)
-        if self.lsl_mouse_streamer:
-            self.lsl_mouse_streamer.push_tracking_data(tracking_point)
-        
-        # Call parent's mouse release event
-        super(QWebEngineView, self.web_view).mouseReleaseEvent(event)
+        self._last_mouse_event_time = time.monotonic()
+        self._queue_mouse_sample(event.globalPos(), 'mouse_release')
     
     def _on_mouse_move(self, event):
-        """Handle mouse move events."""
-        cursor_pos = self.web_view.mapFromGlobal(event.globalPos())
-        abs_x, abs_y = cursor_pos.x(), cursor_pos.y()
-        
-        # Normalize coordinates if configured
-        norm_x, norm_y = self._normalize_mouse_coordinates(abs_x, abs_y)
-        
-        tracking_point = {
-            'timestamp': datetime.now().isoformat(),
-            'mouse_position': (norm_x, norm_y),  # Store normalized coordinates
-            'absolute_position': (abs_x, abs_y),  # Also store absolute for reference
-            'event_type': 'mouse_move',
-            'session_id': self.session.session_id
-        }
-        
-        # Stream to LSL (all data goes through LSL, no separate tracking_data)
-        if self.lsl_mouse_streamer:
-            self.lsl_mouse_streamer.push_tracking_data(tracking_point)
-        
-        # Call parent's mouse move event
-        super(QWebEngineView, self.web_view).mouseMoveEvent(event)
+        """Handle mouse move events (recorded at most once per _mouse_move_min_interval)."""
+        now = time.monotonic()
+        if now - self._last_mouse_move_time >= self._mouse_move_min_interval:
+            self._last_mouse_move_time = now
+            self._last_mouse_event_time = now
+            self._queue_mouse_sample(event.globalPos(), 'mouse_move')
     
     def _on_wheel_event(self, event: QWheelEvent):
         """Handle wheel scroll events."""
-        # Use globalPos() for compatibility (Qt5/Qt6)
-        try:
-            global_pos = event.globalPosition().toPoint()
-        except AttributeError:
-            # Fallback for Qt5
-            global_pos = event.globalPos()
-        cursor_pos = self.web_view.mapFromGlobal(global_pos)
-        abs_x, abs_y = cursor_pos.x(), cursor_pos.y()
-        
-        # Normalize coordinates if configured
-        norm_x, norm_y = self._normalize_mouse_coordinates(abs_x, abs_y)
-        
-        # Get scroll delta (angleDelta gives degrees, we'll use pixels for consistency)
-        # angleDelta() returns QPoint with x and y deltas in 1/8th degree units
-        # Convert to pixels: typically 1 degree = ~15 pixels, so 1/8 degree = ~1.875 pixels
-        angle_delta = event.angleDelta()
-        scroll_delta_x = angle_delta.x() / 8.0 * 15.0  # Convert to approximate pixels
-        scroll_delta_y = angle_delta.y() / 8.0 * 15.0
-        
-        # Use pixelDelta if available (more accurate)
-        pixel_delta = event.pixelDelta()
-        if not pixel_delta.isNull():
-            scroll_delta_x = pixel_delta.x()
-            scroll_delta_y = pixel_delta.y()
-        
-        tracking_point = {
-            'timestamp': datetime.now().isoformat(),
-            'mouse_position': (norm_x, norm_y),  # Store normalized coordinates
-            'absolute_position': (abs_x, abs_y),  # Also store absolute for reference
-            'event_type': 'mouse_scroll',
-            'scroll_delta': (scroll_delta_x, scroll_delta_y),
-            'session_id': self.session.session_id
-        }
-        
-        # Stream to LSL (all data goes through LSL, no separate tracking_data)
-        if self.lsl_mouse_streamer:
-            self.lsl_mouse_streamer.push_tracking_data(tracking_point)
-        
-        # Call parent's wheel event
-        super(QWebEngineView, self.web_view).wheelEvent(event)
+        self._last_mouse_event_time = time.monotonic()
+        self._queue_mouse_sample(event.globalPosition().toPoint(), 'mouse_scroll')
     
     def _end_session(self):
         """End the session and save data."""
@@ -1923,21 +2309,7 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
         # Stop any playing video in the webpage - use multiple strategies
         try:
             # Strategy 1: Stop video via JavaScript (aggressive)
-            stop_video_js = """
-            (function() {
-                const video = document.getElementById('attentionVideo');
-                if (video) {
-                    video.pause();
-                    video.currentTime = 0;
-                    video.muted = true;
-                    // Remove source to completely stop playback
-                    const src = video.src;
-                    video.src = '';
-                    video.load();
-                }
-            })();
-            """
-            self.web_view.page().runJavaScript(stop_video_js)
+            self.web_view.page().runJavaScript(_STOP_VIDEO_JS)
             
             # Strategy 2: Unload the webpage completely to force QtWebEngine to stop all media
             # This is the most reliable way - unloading the page stops all media playback
@@ -1955,6 +2327,8 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
         # Stop tracking
         if hasattr(self, 'tracking_timer'):
             self.tracking_timer.stop()
+        if hasattr(self, '_mouse_flush_timer'):
+            self._mouse_flush_timer.stop()
         
         # Stop screen recording and store recorder reference for saving metadata
         screen_recorder_to_save = self.screen_recorder
@@ -1967,10 +2341,8 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
                 print(f"Error stopping screen recording: {e}")
             self.screen_recorder = None
         
-        # Stop LSL recording
-        if self.lsl_timer:
-            self.lsl_timer.stop()
-            self.lsl_timer = None
+        # Push the last queued mouse samples while the recorder is still running
+        self._flush_mouse_events()
         
         # Store recorder reference before stopping (we need it for saving)
         lsl_recorder_to_save = self.lsl_recorder
@@ -1986,6 +2358,7 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             self.lsl_streamer.close()
             self.lsl_streamer = None
         if self.lsl_mouse_streamer:
+            # close() pushes the samples still queued
             self.lsl_mouse_streamer.close()
             self.lsl_mouse_streamer = None
         
@@ -2038,7 +2411,7 @@ class EmbeddedWebpageSessionWindow(QMainWindow):
             try:
                 # Always try to save, even if recorded_data is empty (might have stream info)
                 # Get recorded data count before saving
-                sample_count = len(self.lsl_recorder.recorded_data) if hasattr(self.lsl_recorder, 'recorded_data') and self.lsl_recorder.recorded_data else 0
+                sample_count = self.lsl_recorder.sample_count
                 
                 # Save LSL data only (no additional_tracking_data - everything is in LSL)
                 self.lsl_recorder.save_to_file(str(lsl_file), additional_tracking_data=None)
@@ -2205,11 +2578,11 @@ class SessionCreationDialog(QDialog):
         
         # Session info
         info_label = QLabel(f"Project: {self.project.name}")
-        info_label.setStyleSheet("color: gray; font-style: italic;")
+        info_label.setStyleSheet(_HINT_CSS)
         form_layout.addRow("Project:", info_label)
         
-        type_label = QLabel(self.project.project_type.value.replace('_', ' ').title())
-        type_label.setStyleSheet("color: gray; font-style: italic;")
+        type_label = QLabel(_PROJECT_TYPE_DISPLAY[self.project.project_type])
+        type_label.setStyleSheet(_HINT_CSS)
         form_layout.addRow("Type:", type_label)
         
         layout.addLayout(form_layout)
@@ -2472,7 +2845,7 @@ class SessionReviewWindow(QMainWindow):
                 video_file = tracking_dir / "screen_recording.mp4"
             
             if video_file.exists():
-                if not CV2_AVAILABLE:
+                if _get_cv2() is None:
                     print(f"[SessionReview] opencv-python not available, cannot load video")
                     self.video_cap = None
                 else:
@@ -2659,7 +3032,7 @@ class SessionReviewWindow(QMainWindow):
         if not self.video_cap:
             placeholder_text = self.video_scene.addText(
                 "Video/Webpage Playback\n(Screen recording not available)",
-                QFont("Arial", 16)
+                _font("Arial", 16)
             )
             placeholder_text.setDefaultTextColor(QColor(255, 255, 255))
             placeholder_text.setPos(200, 250)
@@ -2786,7 +3159,7 @@ class SessionReviewWindow(QMainWindow):
             plots_layout.addWidget(self.plot_canvas)
         else:
             no_plot_label = QLabel("matplotlib not available for graphing")
-            no_plot_label.setStyleSheet("color: gray; font-style: italic;")
+            no_plot_label.setStyleSheet(_HINT_CSS)
             plots_layout.addWidget(no_plot_label)
         
         plots_group.setLayout(plots_layout)
@@ -2865,7 +3238,7 @@ class SessionReviewWindow(QMainWindow):
                     checkbox = QCheckBox(f"{stream_name} Ch{ch_idx}")
                     # Check first 2 by default
                     checkbox.setChecked(idx < 2)
-                    checkbox.stateChanged.connect(lambda: self._redraw_plots())
+                    checkbox.stateChanged.connect(self._redraw_plots)
                     self.channel_layout.addWidget(checkbox)
                     self.channel_checkboxes.append((checkbox, stream_name, ch_idx))
                 
@@ -3817,6 +4190,11 @@ class MainWindow(QMainWindow):
     def _on_new_session(self):
         """Handle new session request."""
         if self.current_project.project_type == ProjectType.EMBEDDED_WEBPAGE:
+            if not WEBENGINE_AVAILABLE:
+                QMessageBox.warning(self, "Warning",
+                                    "Qt WebEngine is not installed. Embedded webpage sessions are unavailable.")
+                return
+            
             # Show session creation dialog
             dialog = SessionCreationDialog(self.current_project, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -3923,6 +4301,8 @@ class MainWindow(QMainWindow):
                     from .models import EmbeddedWebpageConfig
                     # Preserve existing LSL config if it exists
                     existing_lsl_config = self.current_project.embedded_webpage_config.lsl_config if self.current_project.embedded_webpage_config else None
+                    # Not edited in the dialog; keep the project's value
+                    existing_move_interval = self.current_project.embedded_webpage_config.mouse_move_min_interval_ms if self.current_project.embedded_webpage_config else 8.0
                     self.current_project.embedded_webpage_config = EmbeddedWebpageConfig(
                         webpage_url=dialog.project_config.get('webpage_url'),
                         local_html_path=Path(dialog.project_config.get('local_html_path')) if dialog.project_config.get('local_html_path') else None,
@@ -3932,6 +4312,8 @@ class MainWindow(QMainWindow):
                         window_size=dialog.project_config.get('window_size'),
                         enforce_fullscreen=dialog.project_config.get('enforce_fullscreen', False),
                         normalize_mouse_coordinates=dialog.project_config.get('normalize_mouse_coordinates', True),
+                        poll_cursor_when_idle=dialog.project_config.get('poll_cursor_when_idle', False),
+                        mouse_move_min_interval_ms=existing_move_interval,
                         lsl_config=existing_lsl_config  # Preserve LSL config
                     )
                 
@@ -78,6 +78,8 @@ class EmbeddedWebpageConfig:
     window_size: Optional[tuple[int, int]] = None  # (width, height) - enforced window size for consistent data alignment
     enforce_fullscreen: bool = False  # If True, forces fullscreen mode (overrides window_size)
     normalize_mouse_coordinates: bool = True  # If True, mouse positions are normalized (0-1) relative to window size
+    poll_cursor_when_idle: bool = False  # If True, the cursor position is also sampled at 10 Hz while the mouse is not moving
+    mouse_move_min_interval_ms: float = 8.0  # Minimum time between recorded mouse moves (~125 Hz); 0 records every move
     lsl_config: Optional[LSLConfig] = None  # LSL stream configuration
 
 
@@ -152,6 +154,8 @@ class Project:
                 'window_size': self.embedded_webpage_config.window_size,
                 'enforce_fullscreen': self.embedded_webpage_config.enforce_fullscreen,
                 'normalize_mouse_coordinates': self.embedded_webpage_config.normalize_mouse_coordinates,
+                'poll_cursor_when_idle': self.embedded_webpage_config.poll_cursor_when_idle,
+                'mouse_move_min_interval_ms': self.embedded_webpage_config.mouse_move_min_interval_ms,
                 'lsl_config': lsl_config_data
             }
         
@@ -244,6 +248,8 @@ class Project:
                 window_size=tuple(config['window_size']) if config.get('window_size') else None,
                 enforce_fullscreen=config.get('enforce_fullscreen', False),
                 normalize_mouse_coordinates=config.get('normalize_mouse_coordinates', True),
+                poll_cursor_when_idle=config.get('poll_cursor_when_idle', False),
+                mouse_move_min_interval_ms=config.get('mouse_move_min_interval_ms', 8.0),
                 lsl_config=lsl_config
             )
         
@@ -8,10 +8,29 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any, Set
 import shutil
 
+# Try to import orjson for faster metadata parsing (optional dependency)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import local modules using relative imports
 from .models import Project, Session, TrackingData, Marker, ProjectType
 
 
+def _load_json(path: Path) -> Any:
+    """Read and parse a JSON file, using orjson when available."""
+    data = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity written by json.dump; the stdlib parser accepts those
+            pass
+    return json.loads(data)
+
+
 class ProjectManager:
     """Manages project creation, loading, and file operations."""
     
@@ -132,6 +151,8 @@ class ProjectManager:
                 window_size=tuple(config['window_size']) if config and config.get('window_size') else None,
                 enforce_fullscreen=config.get('enforce_fullscreen', False) if config else False,
                 normalize_mouse_coordinates=config.get('normalize_mouse_coordinates', True) if config else True,
+                poll_cursor_when_idle=config.get('poll_cursor_when_idle', False) if config else False,
+                mouse_move_min_interval_ms=config.get('mouse_move_min_interval_ms', 8.0) if config else 8.0,
                 lsl_config=lsl_config
             )
         
@@ -179,8 +200,7 @@ class ProjectManager:
             raise FileNotFoundError(f"Project metadata not found at {metadata_file}")
         
         try:
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(metadata_file)
             logger.debug("Project JSON loaded")
         
             project = Project.from_dict(data)
@@ -334,8 +354,7 @@ class ProjectManager:
             return None
         
         try:
-            with open(lsl_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_json(lsl_file)
         except Exception as e:
             print(f"Error loading LSL data for session {session.session_id}: {e}")
             return None
@@ -360,8 +379,7 @@ class ProjectManager:
             return None
         
         try:
-            with open(info_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_json(info_file)
         except Exception as e:
             print(f"Error loading video info for session {session.session_id}: {e}")
             return None
@@ -706,8 +724,7 @@ class ProjectManager:
             return None
         
         try:
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json(metadata_file)
             return Session.from_dict(data)
         except Exception as e:
             print(f"Error loading session {session_id}: {e}")
@@ -729,8 +746,7 @@ class ProjectManager:
         
         try:
             for data_file in session_dir.glob("tracking_*.json"):
-                with open(data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json(data_file)
                 tracking_data.append(TrackingData.from_dict(data))
         except Exception as e:
             print(f"Error loading tracking data for session {session.session_id}: {e}")
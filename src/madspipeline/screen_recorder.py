@@ -277,6 +277,9 @@ class ScreenRecorder:
     def _capture_loop(self):
         """Capture screen frames in a separate thread."""
         last_capture_time = time.time()
+        # Frame buffers reused from frame to frame so steady-state capture does not allocate
+        bgr_buffer = None
+        output_buffer = np.empty((self.output_height, self.output_width, 3), dtype=np.uint8)
         
         with mss.mss() as sct:
             # Determine capture region
@@ -426,18 +429,20 @@ class ScreenRecorder:
                         if capture_region and capture_region['width'] > 0 and capture_region['height'] > 0:
                             screenshot = sct.grab(capture_region)
                             
-                            # Convert to numpy array
-                            img = np.array(screenshot)
+                            # View the captured BGRA pixels in place (no copy)
+                            captured_height, captured_width = screenshot.height, screenshot.width
+                            img = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(captured_height, captured_width, 4)
                             
-                            # Convert BGRA to BGR (opencv uses BGR)
-                            img_bgr = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-                            
-                            # Get actual captured dimensions
-                            captured_height, captured_width = img_bgr.shape[:2]
+                            # Convert BGRA to BGR (opencv uses BGR), reusing the previous
+                            # frame's buffer while the capture size stays the same
+                            if bgr_buffer is None or bgr_buffer.shape[:2] != (captured_height, captured_width):
+                                bgr_buffer = np.empty((captured_height, captured_width, 3), dtype=np.uint8)
+                            img_bgr = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR, dst=bgr_buffer)
                             
                             # Resize if output resolution differs from capture resolution
                             if self.output_width != captured_width or self.output_height != captured_height:
-                                img_bgr = cv2.resize(img_bgr, (self.output_width, self.output_height), interpolation=cv2.INTER_LINEAR)
+                                img_bgr = cv2.resize(img_bgr, (self.output_width, self.output_height), dst=output_buffer,
+                                                     interpolation=cv2.INTER_LINEAR)
                             
                             # Write frame to video
                             if self.video_writer and self.video_writer.isOpened():
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar sample storage used by LSLRecorder.
+"""
+import json
+import sys
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import numpy as np
+import pytest
+
+lsl_integration = pytest.importorskip("madspipeline.lsl_integration")
+_StreamBuffer = lsl_integration._StreamBuffer
+
+
+def test_numeric_buffer_grows_and_keeps_samples():
+    """Numeric samples survive capacity growth in order."""
+    buf = _StreamBuffer(channel_count=3, numeric=True, capacity=2)
+
+    buf.append([[1, 2, 3], [4, 5, 6]], [10.0, 10.1], 0.5, local_time=1.0)
+    buf.append([[7, 8, 9]], [10.2], 0.25, local_time=2.0)
+
+    assert buf.size == 3
+    assert len(buf.timestamps) >= 3
+    assert buf.sample_data(2) == [7.0, 8.0, 9.0]
+    assert list(buf.timestamps[:buf.size]) == [10.0, 10.1, 10.2]
+    assert list(buf.clock_offsets[:buf.size]) == [0.5, 0.5, 0.25]
+
+
+def test_numeric_buffer_keeps_stream_dtype():
+    """Samples are stored in the stream's dtype, so int streams stay ints."""
+    floats = _StreamBuffer(channel_count=2, numeric=True, dtype=np.float32)
+    ints = _StreamBuffer(channel_count=2, numeric=True, dtype=np.int32)
+
+    floats.append(np.array([[0.5, 1.5]], dtype=np.float32), [1.0], 0.0, local_time=0.0)
+    ints.append([[1, 2]], [1.0], 0.0, local_time=0.0)
+
+    assert floats.data.dtype == np.float32
+    assert floats.sample_data(0) == [0.5, 1.5]
+    assert ints.sample_data(0) == [1, 2]
+    assert all(isinstance(v, int) for v in ints.sample_data(0))
+
+
+def test_capped_buffer_discards_oldest_samples():
+    """A buffer with max_size keeps the newest samples and counts the rest."""
+    buf = _StreamBuffer(channel_count=1, numeric=True, capacity=2, max_size=4)
+
+    for i in range(4):
+        buf.append([[float(i)]], [float(i)], 0.0, local_time=0.0)
+    view = buf.data[:buf.size]
+    buf.append([[4.0]], [4.0], 0.0, local_time=0.0)
+
+    assert buf.size + buf.dropped == 5
+    assert buf.size <= 4
+    assert list(buf.timestamps[:buf.size]) == [float(i) for i in range(buf.dropped, 5)]
+    assert view[:, 0].tolist() == [0.0, 1.0, 2.0, 3.0]  # earlier views are not overwritten
+
+
+def test_string_buffer_keeps_raw_samples():
+    """String streams (bridge markers) keep their samples as lists."""
+    buf = _StreamBuffer(channel_count=1, numeric=False)
+
+    buf.append([['{"type": "page_load"}']], [5.0], 0.0, local_time=5.0)
+
+    assert buf.size == 1
+    assert buf.sample_data(0) == ['{"type": "page_load"}']
+
+
+def test_parse_sample_decodes_bridge_events():
+    """JSON marker samples are decoded; numeric samples are kept as-is."""
+    stream_info = {'name': 'MadsPipeline_BridgeEvents', 'type': 'Markers'}
+    parse = lsl_integration.LSLRecorder._parse_sample
+
+    event = parse({'timestamp': 1.0, 'relative_time': 0.5, 'data': ['{"type": "page_load"}'],
+                   'stream_info': stream_info, 'clock_offset': 0.0})
+    numeric = parse({'timestamp': 1.0, 'relative_time': 0.5, 'data': [1.0, 2.0, 3.0],
+                     'stream_info': stream_info, 'clock_offset': 0.0})
+
+    assert event['data'] == {'type': 'page_load'}
+    assert event['raw_data'] == ['{"type": "page_load"}']
+    assert event['stream_name'] == 'MadsPipeline_BridgeEvents'
+    assert numeric['data'] == [1.0, 2.0, 3.0]
+
+
+def test_get_samples_since_returns_only_new_samples():
+    """Incremental reads merge streams by timestamp and skip samples already seen."""
+    recorder = lsl_integration.LSLRecorder("test_session")
+    recorder.stream_info = [{'name': 'A'}, {'name': 'B'}]
+    recorder._buffers = [_StreamBuffer(1, numeric=True), _StreamBuffer(1, numeric=True)]
+    recorder._buffers[0].append([[1.0], [3.0]], [1.0, 3.0], 0.0, local_time=0.0)
+    recorder._buffers[1].append([[2.0]], [2.0], 0.0, local_time=0.0)
+
+    first, positions = recorder.get_samples_since(None, 50)
+    recorder._buffers[1].append([[4.0]], [4.0], 0.0, local_time=0.0)
+    second, _ = recorder.get_samples_since(positions, 50)
+
+    assert [s['data'] for s in first] == [[1.0], [2.0], [3.0]]
+    assert [s['data'] for s in second] == [[4.0]]
+
+
+def test_mouse_tracking_flush_pushes_queued_positions():
+    """Queued positions are pushed as one chunk of [x, y, event code] with their own timestamps."""
+    class FakeOutlet:
+        def __init__(self):
+            self.chunks = []
+
+        def push_chunk(self, samples, timestamps):
+            self.chunks.append((samples, timestamps))
+
+    streamer = lsl_integration.LSLMouseTrackingStreamer("test_session")
+    outlet = streamer.outlet = FakeOutlet()
+
+    streamer.queue_position(0.25, 0.75, 'mouse_scroll')
+    streamer.queue_position(3.0, 4.0)
+    streamer.flush()
+    streamer.flush()
+
+    assert len(outlet.chunks) == 1
+    samples, timestamps = outlet.chunks[0]
+    assert samples == [(0.25, 0.75, 4.0), (3.0, 4.0, 0.0)]
+    assert len(timestamps) == 2 and timestamps[0] <= timestamps[1]
+
+
+def test_save_removes_spool_and_recorder_stays_readable(tmp_path):
+    """Saving a spooled recording writes every sample and leaves the recorder usable."""
+    recorder = lsl_integration.LSLRecorder("test_session")
+    recorder.stream_info = [{'name': 'A', 'type': 'EEG'}]
+    recorder._buffers = [_StreamBuffer(1, numeric=True)]
+    recorder.spool_path = tmp_path / "spool.jsonl"
+    recorder._spool = open(recorder.spool_path, 'w', encoding='utf-8')
+    recorder._spool_chunk(0, [[1.0], [2.0]], [1.0, 2.0], 0.0)
+    recorder.stop_recording()
+
+    saved_file = tmp_path / "lsl.json"
+    recorder.save_to_file(str(saved_file))
+
+    saved = json.loads(saved_file.read_text(encoding='utf-8'))
+    assert [s['data'] for s in saved['lsl_samples']] == [[1.0], [2.0]]
+    assert not (tmp_path / "spool.jsonl").exists()
+    assert recorder.get_recorded_data() == []
+    assert recorder.sample_count == 0
+
+
+def test_save_keeps_nan_samples(tmp_path):
+    """Non-finite floats (e.g. gaze samples with no data) are saved as NaN, not null."""
+    recorder = lsl_integration.LSLRecorder("test_session")
+    recorder.stream_info = [{'name': 'Gaze', 'type': 'Gaze'}]
+    recorder._buffers = [_StreamBuffer(2, numeric=True)]
+    recorder.spool_path = tmp_path / "spool.jsonl"
+    recorder._spool = open(recorder.spool_path, 'w', encoding='utf-8')
+    recorder._spool_chunk(0, np.array([[np.nan, 0.5], [1.0, 2.0]]), [1.0, 2.0], 0.0)
+    recorder.stop_recording()
+
+    saved_file = tmp_path / "lsl.json"
+    recorder.save_to_file(str(saved_file))
+
+    samples = json.loads(saved_file.read_text(encoding='utf-8'))['lsl_samples']
+    assert np.isnan(samples[0]['data'][0]) and samples[0]['data'][1] == 0.5
+    assert samples[1]['data'] == [1.0, 2.0]
+
+
+class _FakeInlet:
+    """Inlet returning one chunk; time_correction() runs a hook, then fails or returns."""
+
+    def __init__(self, on_time_correction=None, offset=None):
+        self.on_time_correction = on_time_correction
+        self.offset = offset
+
+    def pull_chunk(self, timeout=0.0, max_samples=1024, dest_obj=None):
+        return [[1.0]], [1.0]
+
+    def time_correction(self, timeout=None):
+        if self.on_time_correction:
+            self.on_time_correction()
+        if self.offset is None:
+            raise TimeoutError("time_correction timed out")
+        return self.offset
+
+    def close_stream(self):
+        pass
+
+
+def _spooling_recorder(tmp_path, inlet):
+    recorder = lsl_integration.LSLRecorder("test_session")
+    recorder.stream_info = [{'name': 'A'}]
+    recorder._buffers = [_StreamBuffer(1, numeric=True)]
+    recorder._pull_buffers = [None]
+    recorder.inlets = [inlet]
+    recorder._clock_offsets = [0.25]
+    recorder.spool_path = tmp_path / "spool.jsonl"
+    recorder._spool = open(recorder.spool_path, 'w', encoding='utf-8')
+    recorder.is_recording = True
+    return recorder
+
+
+def test_record_sample_stops_writing_once_recording_stopped(tmp_path):
+    """A poll that is still running when stop_recording() closes the spool records nothing."""
+    inlet = _FakeInlet(offset=0.5)
+    recorder = _spooling_recorder(tmp_path, inlet)
+    inlet.on_time_correction = recorder.stop_recording
+
+    assert recorder.record_sample() == 0
+    assert recorder.spool_path.read_text(encoding='utf-8') == ''
+
+
+def test_record_sample_reuses_clock_offset_when_time_correction_fails(tmp_path):
+    """A timed-out clock offset query keeps the chunk, with the inlet's previous offset."""
+    recorder = _spooling_recorder(tmp_path, _FakeInlet())
+
+    assert recorder.record_sample() == 1
+    recorder.stop_recording()
+    assert [s['clock_offset'] for s in recorder.get_recorded_data()] == [0.25]